@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Callable
 import logging
 import resource
@@ -10,6 +11,7 @@ import sys
 import tracemalloc
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
@@ -24,12 +26,14 @@ from .const import (
     CONF_EBUS_BROKER_PASSWORD,
     CONF_EBUS_BROKER_PORT,
     CONF_EBUS_BROKER_USERNAME,
+    CONF_MEMORY_DIAGNOSTICS,
     CONF_SERIAL_NUMBER,
     DESCRIPTION_TIMEOUT,
     DEVICE_READY_TIMEOUT,
     DOMAIN,
     PLATFORMS,
 )
+from .models import SpanDomainData, SpanPanelEntry
 
 MEMORY_DIAG_INTERVAL = timedelta(minutes=30)
 from .services import async_setup_services
@@ -39,11 +43,20 @@ _LOGGER = logging.getLogger(__name__)
 
 
 _prev_snapshot: tracemalloc.Snapshot | None = None
+_prev_diag_stats: tuple[float, float, list[str]] | None = None
 
 
-def _log_memory_diagnostics(panels: dict) -> None:
-    """Log memory diagnostics for all active SPAN panels."""
-    global _prev_snapshot  # noqa: PLW0603
+def _log_memory_diagnostics(panels: dict[str, SpanPanelEntry]) -> None:
+    """Log memory diagnostics for all active SPAN panels.
+
+    Logs only when peak RSS, traced memory or a panel's counters moved since
+    the last tick.
+    """
+    global _prev_snapshot, _prev_diag_stats  # noqa: PLW0603
+
+    # Checked per tick so a runtime log-level change takes effect
+    if not _LOGGER.isEnabledFor(logging.INFO):
+        return
 
     # Peak RSS in bytes (macOS returns bytes, Linux returns KB)
     peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
@@ -51,17 +64,10 @@ def _log_memory_diagnostics(panels: dict) -> None:
         peak_rss *= 1024  # Linux ru_maxrss is in KB
     peak_mb = peak_rss / (1024 * 1024)
 
-    # Traced memory from tracemalloc
-    if tracemalloc.is_tracing():
-        traced_current, traced_peak = tracemalloc.get_traced_memory()
-        traced_mb = traced_current / (1024 * 1024)
-    else:
-        traced_mb = 0.0
-
-    panel_stats = []
-    for entry_id, data in panels.items():
-        panel = data.get("panel")
-        if panel and panel._controller:
+    panel_stats: list[str] = []
+    for data in panels.values():
+        panel = data.panel
+        if panel._controller:
             ctrl = panel._controller
             device_count = len(ctrl.devices)
             sub_count = len(ctrl.mqttc.sub_callbacks) if ctrl.mqttc else 0
@@ -79,6 +85,19 @@ def _log_memory_diagnostics(panels: dict) -> None:
                 f"paho_in={paho_in},paho_out={paho_out})"
             )
 
+    # Traced memory from tracemalloc
+    if tracemalloc.is_tracing():
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+        traced_mb = traced_current / (1024 * 1024)
+    else:
+        traced_mb = 0.0
+
+    # Nothing new to report since the previous tick (at the logged 0.1MB resolution)
+    stats = (round(peak_mb, 1), round(traced_mb, 1), panel_stats)
+    if _prev_diag_stats == stats:
+        return
+    _prev_diag_stats = stats
+
     _LOGGER.info(
         "Memory diagnostics: peak_rss=%.1fMB, traced=%.1fMB, panels=[%s]",
         peak_mb,
@@ -98,11 +117,55 @@ def _log_memory_diagnostics(panels: dict) -> None:
             _LOGGER.exception("tracemalloc snapshot failed")
 
 
+def _start_memory_diagnostics(
+    hass: HomeAssistant, domain_data: SpanDomainData, entry_id: str
+) -> None:
+    """Opt an entry in to memory diagnostics, starting them for the first one."""
+    domain_data.memory_diag_entries.add(entry_id)
+    if domain_data.memory_diag_unsub is not None:
+        return
+
+    # Every tick logs at INFO, so don't trace or wake HA if it would be dropped
+    if not _LOGGER.isEnabledFor(logging.INFO):
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        domain_data.memory_diag_tracemalloc = True
+        _LOGGER.info("tracemalloc started for memory leak diagnostics")
+
+    def _diag_callback(_now) -> None:
+        _log_memory_diagnostics(domain_data.panels)
+
+    domain_data.memory_diag_unsub = async_track_time_interval(
+        hass, _diag_callback, MEMORY_DIAG_INTERVAL
+    )
+
+
+def _stop_memory_diagnostics(domain_data: SpanDomainData, entry_id: str) -> None:
+    """Opt an entry out of memory diagnostics, stopping them after the last one."""
+    global _prev_snapshot, _prev_diag_stats  # noqa: PLW0603
+
+    domain_data.memory_diag_entries.discard(entry_id)
+    if domain_data.memory_diag_entries:
+        return
+
+    if domain_data.memory_diag_unsub is not None:
+        domain_data.memory_diag_unsub()
+        domain_data.memory_diag_unsub = None
+    if domain_data.memory_diag_tracemalloc:
+        tracemalloc.stop()
+        domain_data.memory_diag_tracemalloc = False
+        _LOGGER.info("tracemalloc stopped")
+    _prev_snapshot = None
+    _prev_diag_stats = None
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SPAN Panel (eBus) from a config entry."""
     # Import here so the config flow can be discovered before ebus-sdk is installed.
     # HA installs manifest requirements between config flow and setup_entry.
-    from .node_mappers import entities_from_description  # noqa: PLC0415
+    from .node_mappers import EntitySpec, entities_from_description  # noqa: PLC0415
     from .span_panel import SpanPanel  # noqa: PLC0415
 
     # Register services once (first entry only)
@@ -150,16 +213,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Log description node summary for diagnostics
     nodes = description.get("nodes", {})
-    node_types = {}
-    for node_desc in nodes.values():
-        ntype = node_desc.get("type", "unknown")
-        node_types[ntype] = node_types.get(ntype, 0) + 1
-    _LOGGER.debug(
-        "SPAN Panel %s: description has %d nodes: %s",
-        serial_number,
-        len(nodes),
-        ", ".join(f"{v}x {k}" for k, v in sorted(node_types.items())),
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        node_types = Counter(nd.get("type", "unknown") for nd in nodes.values())
+        _LOGGER.debug(
+            "SPAN Panel %s: description has %d nodes: %s",
+            serial_number,
+            len(nodes),
+            ", ".join(f"{v}x {k}" for k, v in sorted(node_types.items())),
+        )
 
     # Wait for the device to reach "ready" — $state=ready arrived via MQTT.
     # Note: this does NOT guarantee all retained property values have been
@@ -196,10 +257,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 len(circuit_node_ids),
             )
         else:
+            names = panel.snapshot_property("name")
             available = sum(
-                1
-                for nid in circuit_node_ids
-                if panel.get_property_value(nid, "name") is not None
+                1 for nid in circuit_node_ids if names.get(nid) is not None
             )
             _LOGGER.warning(
                 "SPAN Panel %s: timed out waiting for circuit names "
@@ -223,76 +283,79 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         **panel_device_info(serial_number, firmware),
     )
 
-    # Register sub-devices (circuits, BESS, PV, EVSE) as children of the panel
-    _register_subdevices(device_registry, entry.entry_id, serial_number, entity_specs)
+    # Register sub-devices (circuits, BESS, PV, EVSE) as children of the panel;
+    # the circuit node ids fall out of the same pass over entity_specs.
+    registered_circuit_ids = _register_subdevices(
+        device_registry, entry.entry_id, serial_number, entity_specs
+    )
 
     # Reactively update circuit device names when the "name" property arrives
     # via MQTT (retained values may arrive after entity creation).
     # Store unregister functions so we can clean up in async_unload_entry.
     unregister_callbacks: list[Callable[[], None]] = []
 
-    circuit_node_ids = {
-        spec.node_id
-        for spec in entity_specs
-        if spec.node_type == "energy.ebus.device.circuit"
-    }
-    for node_id in circuit_node_ids:
-        _node = node_id  # capture for closure
-
-        def _on_name_update(value: str, nid: str = _node) -> None:
-            _LOGGER.debug(
-                "Circuit %s name updated to '%s', updating device registry", nid, value
-            )
-            dev_reg = dr.async_get(hass)
-            dev_reg.async_get_or_create(
-                config_entry_id=entry.entry_id,
-                **subdevice_info(
-                    serial_number, nid, "energy.ebus.device.circuit", value
-                ),
-            )
-
-        unregister_callbacks.append(
-            panel.register_property_callback(node_id, "name", _on_name_update)
+    def _on_name_update(nid: str, value: str) -> None:
+        if nid not in registered_circuit_ids:
+            return
+        _LOGGER.debug(
+            "Circuit %s name updated to '%s', updating device registry", nid, value
+        )
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            **subdevice_info(
+                serial_number, nid, "energy.ebus.device.circuit", value
+            ),
         )
 
+    # One wildcard registration covers every circuit's "name" property
+    unregister_callbacks.append(
+        panel.register_node_property_callback("name", _on_name_update)
+    )
+
     # Also refresh all device names on every "ready" transition
-    # (covers reconnections, firmware updates, circuit renames, etc.)
+    # (covers reconnections, firmware updates, circuit renames, etc.).
+    # Device names derive only from the description and the circuit "name"
+    # properties, so a reconnect that changed neither is skipped.  A new
+    # $description is parsed into a new dict, so identity is enough.
+    last_description = panel.description
+    last_names = panel.snapshot_property("name")
+
     def _on_ready() -> None:
+        nonlocal last_description, last_names
+        description = panel.description
+        names = panel.snapshot_property("name")
+        if description is last_description and names == last_names:
+            _LOGGER.debug(
+                "SPAN Panel %s became ready, device names unchanged", serial_number
+            )
+            return
+        last_description, last_names = description, names
         _LOGGER.info("SPAN Panel %s became ready, refreshing device names", serial_number)
         refreshed = entities_from_description(
             panel.description or {}, panel=panel
         )
         _register_subdevices(
-            dr.async_get(hass), entry.entry_id, serial_number, refreshed
+            device_registry, entry.entry_id, serial_number, refreshed
         )
 
     unregister_callbacks.append(panel.register_ready_callback(_on_ready))
 
+    # Bucket specs by platform once so each platform reads only its own list
+    specs_by_platform: dict[Platform, list[EntitySpec]] = {}
+    for spec in entity_specs:
+        specs_by_platform.setdefault(spec.platform, []).append(spec)
+
     # Store panel, specs, and cleanup functions for platform setup / unload
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "panel": panel,
-        "entity_specs": entity_specs,
-        "unregister_callbacks": unregister_callbacks,
-    }
+    domain_data: SpanDomainData = hass.data.setdefault(DOMAIN, SpanDomainData())
+    domain_data.panels[entry.entry_id] = SpanPanelEntry(
+        panel=panel,
+        specs_by_platform=specs_by_platform,
+        unregister_callbacks=unregister_callbacks,
+    )
 
-    # Start tracemalloc and periodic memory diagnostics (once, on first panel setup)
-    if "_memory_diag_unsub" not in hass.data[DOMAIN]:
-        if not tracemalloc.is_tracing():
-            tracemalloc.start()
-            _LOGGER.info("tracemalloc started for memory leak diagnostics")
-
-        def _diag_callback(_now) -> None:
-            panels = {
-                eid: data
-                for eid, data in hass.data.get(DOMAIN, {}).items()
-                if isinstance(data, dict) and "panel" in data
-            }
-            _log_memory_diagnostics(panels)
-
-        hass.data[DOMAIN]["_memory_diag_unsub"] = async_track_time_interval(
-            hass, _diag_callback, MEMORY_DIAG_INTERVAL
-        )
+    # Periodic memory diagnostics, opt-in via options and shared by all entries
+    if entry.options.get(CONF_MEMORY_DIAGNOSTICS, False):
+        _start_memory_diagnostics(hass, domain_data, entry.entry_id)
 
     # Forward setup to each platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -312,43 +375,47 @@ async def _wait_for_circuit_names(
     device has sent everything, but MQTT does not guarantee delivery order.
     We know these "name" properties are coming — wait for them.
 
-    Registers a property callback for each missing circuit name and awaits
-    the corresponding asyncio.Event.  Returns True if all names arrived
-    within the timeout, False otherwise.
+    Registers a property callback for each missing circuit name; each
+    callback removes its circuit from a shared pending set, and a single
+    asyncio.Event is set once the set drains.  Returns True if all names
+    arrived within the timeout, False otherwise.
     """
     # Check which names are already present
-    missing = [
-        nid
-        for nid in circuit_node_ids
-        if panel.get_property_value(nid, "name") is None
-    ]
-    if not missing:
+    names = panel.snapshot_property("name")
+    pending = {nid for nid in circuit_node_ids if names.get(nid) is None}
+    if not pending:
         return True
 
-    # Create an event per missing name and register callbacks
-    events: dict[str, asyncio.Event] = {nid: asyncio.Event() for nid in missing}
+    # One event for the whole batch; property callbacks are dispatched on
+    # the HA event loop, so the pending set needs no extra locking.
+    done = asyncio.Event()
     unregs: list[Callable[[], None]] = []
 
-    for nid in missing:
+    def _mark(nid: str) -> None:
+        pending.discard(nid)
+        if not pending:
+            done.set()
+
+    for nid in pending:
         _nid = nid  # capture for closure
 
         def _on_name(value: str, n: str = _nid) -> None:
-            events[n].set()
+            _mark(n)
 
         unregs.append(panel.register_property_callback(nid, "name", _on_name))
 
     # Re-check after registration in case values arrived between the
     # initial check and callback registration (paho-mqtt thread may have
     # updated device.properties in the meantime).
-    for nid in missing:
-        if panel.get_property_value(nid, "name") is not None:
-            events[nid].set()
+    names = panel.snapshot_property("name")
+    pending.difference_update(
+        [nid for nid in pending if names.get(nid) is not None]
+    )
+    if not pending:
+        done.set()
 
     try:
-        await asyncio.wait_for(
-            asyncio.gather(*(ev.wait() for ev in events.values())),
-            timeout=timeout,
-        )
+        await asyncio.wait_for(done.wait(), timeout=timeout)
         return True
     except TimeoutError:
         return False
@@ -362,21 +429,31 @@ def _register_subdevices(
     config_entry_id: str,
     serial_number: str,
     entity_specs: list,
-) -> None:
-    """Register or update sub-devices (circuits, BESS, PV, EVSE) in the device registry."""
+) -> frozenset[str]:
+    """Register or update sub-devices (circuits, BESS, PV, EVSE) in the device registry.
+
+    Returns the set of circuit node ids seen along the way.
+    """
     from .node_mappers import EntitySpec  # noqa: PLC0415
 
     seen: set[str] = set()
+    circuit_ids: set[str] = set()
     spec: EntitySpec
+    get_or_create = device_registry.async_get_or_create
     for spec in entity_specs:
-        if spec.node_type in _SUB_DEVICE_TYPES and spec.node_id not in seen:
-            seen.add(spec.node_id)
-            device_registry.async_get_or_create(
-                config_entry_id=config_entry_id,
-                **subdevice_info(
-                    serial_number, spec.node_id, spec.node_type, spec.device_name
-                ),
-            )
+        # Most specs share a node with an earlier spec; test seen first
+        if spec.node_id in seen or spec.node_type not in _SUB_DEVICE_TYPES:
+            continue
+        seen.add(spec.node_id)
+        if spec.node_type == "energy.ebus.device.circuit":
+            circuit_ids.add(spec.node_id)
+        get_or_create(
+            config_entry_id=config_entry_id,
+            **subdevice_info(
+                serial_number, spec.node_id, spec.node_type, spec.device_name
+            ),
+        )
+    return frozenset(circuit_ids)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -384,22 +461,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        domain_data: SpanDomainData = hass.data[DOMAIN]
+        data = domain_data.panels.pop(entry.entry_id, None)
         if data:
             # Unregister name-update and ready callbacks before stopping
-            for unreg in data.get("unregister_callbacks", []):
+            for unreg in data.unregister_callbacks:
                 unreg()
-            panel: SpanPanel = data["panel"]
-            await panel.async_stop()
-
-        # If no more panels, cancel the memory diagnostics timer
-        remaining = {
-            k for k in hass.data.get(DOMAIN, {})
-            if k != "_memory_diag_unsub"
-        }
-        if not remaining:
-            unsub = hass.data[DOMAIN].pop("_memory_diag_unsub", None)
-            if unsub:
-                unsub()
+            await data.panel.async_stop()
+
+        # The options flow reloads the entry, so this also runs when the
+        # memory diagnostics option is turned off
+        _stop_memory_diagnostics(domain_data, entry.entry_id)
 
     return unload_ok
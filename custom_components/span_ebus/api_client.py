@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import secrets
 from typing import Any
-import uuid
 
 import aiohttp
 
@@ -13,6 +13,9 @@ from .const import API_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
+# ClientTimeout is immutable, so one instance serves every request
+_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT)
+
 
 class SpanApiError(Exception):
     """Base exception for SPAN API errors."""
@@ -51,6 +54,9 @@ class SpanApiClient:
 
     Used only during config flow for authentication and certificate retrieval.
     Runtime data comes via MQTT/Homie (ebus-sdk Controller).
+
+    Pass Home Assistant's shared session so requests reuse its connection
+    pool; without one, the client creates and owns a private session.
     """
 
     def __init__(self, host: str, session: aiohttp.ClientSession | None = None) -> None:
@@ -79,12 +85,13 @@ class SpanApiClient:
         session = await self._ensure_session()
         url = f"{self._base_url}{path}"
         try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)) as resp:
+            async with session.get(url, timeout=_TIMEOUT) as resp:
                 if resp.status == 401:
                     raise SpanAuthError("Authentication required")
                 resp.raise_for_status()
-                content_type = resp.content_type or ""
-                if "json" in content_type:
+                # Raw header string; resp.content_type re-parses it on access
+                content_type = resp.headers.get("Content-Type", "")
+                if content_type.startswith(("application/json", "text/json")):
                     return await resp.json()
                 return await resp.text()
         except aiohttp.ClientConnectorError as err:
@@ -100,7 +107,7 @@ class SpanApiClient:
             async with session.post(
                 url,
                 json=json_data,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+                timeout=_TIMEOUT,
             ) as resp:
                 if resp.status == 401:
                     raise SpanAuthError("Invalid passphrase")
@@ -147,7 +154,7 @@ class SpanApiClient:
         With passphrase: include hopPassphrase in body.
         Without passphrase (door bypass): omit hopPassphrase.
         """
-        suffix = uuid.uuid4().hex[:8]
+        suffix = secrets.token_hex(4)
         json_data: dict[str, str] = {"name": f"home-assistant-{suffix}"}
         if passphrase:
             json_data["hopPassphrase"] = passphrase
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 from typing import Any
 
@@ -13,13 +14,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_base import SpanEbusEntity
+from .models import SpanPanelEntry
 from .node_mappers import EntitySpec
 
 _LOGGER = logging.getLogger(__name__)
 
 # Values that indicate "on" / True for boolean-typed binary sensors.
 # Enum-typed binary sensors should use EntitySpec.on_values instead.
-_TRUTHY = {"true", "1", "on", "yes", "connected", "active"}
+_TRUTHY = frozenset({"true", "1", "on", "yes", "connected", "active"})
 
 
 async def async_setup_entry(
@@ -28,25 +30,24 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SPAN binary sensor entities from a config entry."""
-    panel = hass.data[DOMAIN][entry.entry_id]["panel"]
-    entity_specs: list[EntitySpec] = hass.data[DOMAIN][entry.entry_id]["entity_specs"]
+    data: SpanPanelEntry = hass.data[DOMAIN].panels[entry.entry_id]
+    panel = data.panel
+    entity_specs = data.specs_by_platform.get(Platform.BINARY_SENSOR)
+    if not entity_specs:
+        return
 
-    entities = [
-        SpanEbusBinarySensor(panel, spec)
-        for spec in entity_specs
-        if spec.platform == Platform.BINARY_SENSOR
-    ]
-
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.debug(
-            "Added %d binary sensor entities for %s", len(entities), panel.serial_number
-        )
+    async_add_entities([SpanEbusBinarySensor(panel, spec) for spec in entity_specs])
+    _LOGGER.debug(
+        "Added %d binary sensor entities for %s", len(entity_specs), panel.serial_number
+    )
 
 
 class SpanEbusBinarySensor(SpanEbusEntity, BinarySensorEntity):
     """A binary sensor entity for a SPAN Panel Homie property."""
 
+    # State flips are rare and should reach HA immediately
+    _coalesce_writes = False
+
     def __init__(self, panel: Any, spec: EntitySpec) -> None:
         """Initialize the binary sensor."""
         super().__init__(panel=panel, spec=spec)
@@ -55,11 +56,27 @@ class SpanEbusBinarySensor(SpanEbusEntity, BinarySensorEntity):
         self._attr_entity_category = spec.entity_category
         if spec.icon:
             self._attr_icon = spec.icon
-        self._on_values = spec.on_values
+        self._match = _on_value_matcher(spec.on_values)
 
     def _update_from_value(self, value: str) -> None:
         """Update binary sensor state from a raw MQTT value."""
-        if self._on_values:
-            self._attr_is_on = value.upper() in self._on_values
-        else:
-            self._attr_is_on = value.lower() in _TRUTHY
+        self._attr_is_on = self._match(value)
+
+    def _state_fingerprint(self) -> tuple:
+        """Return the binary sensor's on/off state."""
+        return (self._attr_is_on,)
+
+
+def _on_value_matcher(on_values: tuple[str, ...]) -> Callable[[str], bool]:
+    """Build the is-on test for a binary sensor once, at construction.
+
+    Most enum sensors have a single "on" value (e.g. OPEN, CLOSED), which
+    reduces to a plain string comparison instead of a membership test.
+    """
+    if len(on_values) == 1:
+        (on_value,) = on_values
+        return lambda value: value.upper() == on_value
+    if on_values:
+        upper_values = frozenset(on_values)
+        return lambda value: value.upper() in upper_values
+    return lambda value: value.lower() in _TRUTHY
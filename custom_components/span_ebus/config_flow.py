@@ -5,8 +5,15 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlowWithReload,
+)
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 import voluptuous as vol
 
@@ -22,6 +29,7 @@ from .const import (
     CONF_EBUS_BROKER_PASSWORD,
     CONF_EBUS_BROKER_PORT,
     CONF_EBUS_BROKER_USERNAME,
+    CONF_MEMORY_DIAGNOSTICS,
     CONF_SERIAL_NUMBER,
     DEFAULT_EBUS_BROKER_PORT,
     DOMAIN,
@@ -42,10 +50,16 @@ class SpanEbusConfigFlow(ConfigFlow, domain=DOMAIN):
         self._firmware_version: str = ""
         self._client: SpanApiClient | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> SpanEbusOptionsFlow:
+        """Create the options flow."""
+        return SpanEbusOptionsFlow()
+
     async def _get_client(self) -> SpanApiClient:
-        """Get or create the API client."""
+        """Get or create the API client (on HA's shared aiohttp session)."""
         if self._client is None:
-            self._client = SpanApiClient(self._host)
+            self._client = SpanApiClient(self._host, async_get_clientsession(self.hass))
         return self._client
 
     async def _close_client(self) -> None:
@@ -98,13 +112,14 @@ class SpanEbusConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # Extract serial from mDNS instance name.
         # Names are like "span-nt-XXXX-XXXXX-EBUS" or "span-nt-XXXX-XXXXX-MQTTS".
-        instance = discovery_info.name.split("._")[0]
+        instance, _, _ = discovery_info.name.partition("._")
         _LOGGER.debug("Zeroconf discovery: name=%s, host=%s", discovery_info.name, discovery_info.host)
         if instance.startswith("span-"):
             # Strip the trailing service suffix (-EBUS, -MQTTS, etc.)
             serial_part = instance[len("span-"):]
             # Remove last segment after final hyphen (the suffix)
-            self._serial_number = serial_part.rsplit("-", 1)[0]
+            serial, sep, _ = serial_part.rpartition("-")
+            self._serial_number = serial if sep else serial_part
 
         # Set unique ID early to deduplicate (each panel advertises on
         # both _ebus._tcp and _secure-mqtt._tcp).
@@ -214,3 +229,28 @@ class SpanEbusConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_CA_CERT_PEM: ca_cert,
             },
         )
+
+
+class SpanEbusOptionsFlow(OptionsFlowWithReload):
+    """Handle options for SPAN Panel (eBus)."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the integration options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MEMORY_DIAGNOSTICS,
+                        default=self.config_entry.options.get(
+                            CONF_MEMORY_DIAGNOSTICS, False
+                        ),
+                    ): bool,
+                }
+            ),
+        )
@@ -14,6 +14,9 @@ CONF_EBUS_BROKER_HOST = "ebus_broker_host"
 CONF_EBUS_BROKER_PORT = "ebus_broker_port"
 CONF_CA_CERT_PEM = "ca_cert_pem"
 
+# Options keys
+CONF_MEMORY_DIAGNOSTICS = "memory_diagnostics"
+
 # Defaults
 DEFAULT_EBUS_BROKER_PORT = 8883
 
@@ -31,6 +34,9 @@ DEVICE_READY_TIMEOUT = 120  # seconds to wait for device "ready" state
 CIRCUIT_NAMES_TIMEOUT = 10  # seconds to wait for circuit name properties after ready
 API_TIMEOUT = 15  # seconds for REST API calls
 
+# State writes
+STATE_WRITE_DELAY = 0.05  # seconds to coalesce bursty MQTT updates per panel
+
 # MQTT
 MQTT_QOS = 1  # QoS 1 avoids paho-mqtt _in_messages accumulation with QoS 2
 EBUS_HOMIE_DOMAIN = "ebus"
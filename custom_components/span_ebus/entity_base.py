@@ -3,20 +3,17 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Callable
 import logging
 
 from homeassistant.helpers.entity import Entity
 
 from .node_mappers import EntitySpec
 from .span_panel import SpanPanel
-from homeassistant.helpers.device_registry import DeviceInfo
-
-from .const import DOMAIN
 from .util import (
     _SUB_DEVICE_TYPES,
     make_unique_id,
     panel_device_info,
+    subdevice_entity_info,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +25,10 @@ class SpanEbusEntity(Entity):
     _attr_should_poll = False
     _attr_has_entity_name = True
 
+    # Coalesce bursts of MQTT updates into the panel's batched state flush.
+    # Subclasses where immediacy matters (relays, binary states) disable it.
+    _coalesce_writes = True
+
     def __init__(self, panel: SpanPanel, spec: EntitySpec) -> None:
         """Initialize the entity."""
         self._panel = panel
@@ -45,51 +46,71 @@ class SpanEbusEntity(Entity):
             # across all platforms. The name is also managed reactively by
             # _register_subdevices and _on_name_update callbacks in __init__.py
             # for updates after initial setup.
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, f"{panel.serial_number}_{spec.node_id}")},
-                name=spec.device_name,
+            self._attr_device_info = subdevice_entity_info(
+                panel.serial_number, spec.node_id, spec.device_name
             )
         else:
             self._attr_device_info = panel_device_info(panel.serial_number)
 
-        self._unregister_property: Callable[[], None] | None = None
-        self._unregister_availability: Callable[[], None] | None = None
-
-    @property
-    def available(self) -> bool:
-        """Return True if the panel is available."""
-        return self._panel.available
+        # Last state handed to HA, used to drop no-op writes
+        self._last_written: tuple | None = None
+        # Plain attribute read by Entity.available; updated by the panel's
+        # availability callback instead of delegating on every state write
+        self._attr_available = panel.available
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added to HA."""
-        # Register for property updates (use source_property_id for MQTT subscription)
-        self._unregister_property = self._panel.register_property_callback(
-            self._node_id, self._source_property_id, self._on_value_update
+        # Register for property updates (use source_property_id for MQTT subscription).
+        # async_on_remove runs the unregister functions when the entity is removed.
+        self.async_on_remove(
+            self._panel.register_property_callback(
+                self._node_id, self._source_property_id, self._on_value_update
+            )
         )
         # Register for availability updates
-        self._unregister_availability = self._panel.register_availability_callback(
-            self._on_availability_update
+        self.async_on_remove(
+            self._panel.register_availability_callback(self._on_availability_update)
         )
+        self.async_on_remove(self._discard_pending_write)
 
-        # Set initial value if already known
+        # Set initial value if already known (attributes only; HA's
+        # add_to_platform_finish performs the first state write)
         current = self._panel.get_property_value(self._node_id, self._source_property_id)
         if current is not None:
             self._update_from_value(current)
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Unregister callbacks when entity is removed."""
-        if self._unregister_property:
-            self._unregister_property()
-        if self._unregister_availability:
-            self._unregister_availability()
+        # HA writes the initial state right after this returns
+        self._last_written = self._state_fingerprint()
+        # Catch any availability change between __init__ and registration
+        self._attr_available = self._panel.available
 
     def _on_value_update(self, value: str) -> None:
         """Handle a property value update from MQTT (HA event loop)."""
         self._update_from_value(value)
+        if self._state_fingerprint() == self._last_written:
+            return
+        if self._coalesce_writes:
+            self._panel.mark_dirty(self)
+        else:
+            self._flush_state()
+
+    def _flush_state(self) -> None:
+        """Write the current state if it differs from the last write."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_written:
+            return
+        self._last_written = fingerprint
         self.async_write_ha_state()
 
+    def _discard_pending_write(self) -> None:
+        """Drop a queued state write (entity removal)."""
+        self._panel.discard_dirty(self)
+
     def _on_availability_update(self, available: bool) -> None:
         """Handle availability change (HA event loop)."""
+        if available == self._attr_available:
+            return
+        self._attr_available = available
         self.async_write_ha_state()
 
     @abstractmethod
@@ -97,5 +118,15 @@ class SpanEbusEntity(Entity):
         """Update entity state from a raw MQTT property value.
 
         Subclasses must implement this to parse the value string
-        into the appropriate native state.
+        into the appropriate native state.  It must only set _attr_*
+        fields: _on_value_update owns the state write, and during
+        async_added_to_hass HA writes the initial state itself.
+        """
+
+    @abstractmethod
+    def _state_fingerprint(self) -> tuple:
+        """Return the state attributes that _update_from_value may change.
+
+        Compared before each write so repeated MQTT values that leave the
+        state unchanged do not produce a state_changed event.
         """
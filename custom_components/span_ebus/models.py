@@ -0,0 +1,34 @@
+"""Runtime data containers for SPAN Panel (eBus) integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from homeassistant.const import Platform
+
+if TYPE_CHECKING:
+    from .node_mappers import EntitySpec
+    from .span_panel import SpanPanel
+
+
+@dataclass
+class SpanPanelEntry:
+    """Per-config-entry state shared between setup, platforms, and unload."""
+
+    panel: SpanPanel
+    specs_by_platform: dict[Platform, list[EntitySpec]]
+    unregister_callbacks: list[Callable[[], None]]
+
+
+@dataclass
+class SpanDomainData:
+    """Integration-wide state stored under hass.data[DOMAIN]."""
+
+    panels: dict[str, SpanPanelEntry] = field(default_factory=dict)
+    memory_diag_unsub: Callable[[], None] | None = None
+    # Entry ids with memory diagnostics enabled in their options
+    memory_diag_entries: set[str] = field(default_factory=set)
+    # Whether tracemalloc was started by us, and so is ours to stop
+    memory_diag_tracemalloc: bool = False
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import KW_ONLY, dataclass
+from functools import lru_cache
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -20,24 +22,31 @@ from homeassistant.const import (
     UnitOfPower,
 )
 
+from .util import _NODE_TYPE_LABELS, _SUB_DEVICE_TYPES
+
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntitySpec:
-    """Descriptor for an entity to be created from a Homie property."""
+    """Descriptor for an entity to be created from a Homie property.
+
+    Slotted: one is built per entity on every description parse. Frozen:
+    specs are shared read-only by entities and cached test fixtures.
+    """
 
     platform: Platform
     node_id: str
     property_id: str
     name: str
+    _: KW_ONLY
     # Sensor-specific
     device_class: Any | None = None
     state_class: SensorStateClass | None = None
     native_unit: str | None = None
     entity_category: EntityCategory | None = None
     # Select-specific
-    options: list[str] = field(default_factory=list)
+    options: tuple[str, ...] = ()
     # Subscribe to a different property than property_id for MQTT updates.
     # When set, the entity unique_id uses property_id but MQTT subscription
     # uses source_property_id.  Empty string means "same as property_id".
@@ -50,7 +59,7 @@ class EntitySpec:
     # Whether this property is settable (for switches/selects)
     settable: bool = False
     # Binary sensor: values (uppercase) that mean "on"; empty = use default truthy set
-    on_values: set[str] = field(default_factory=set)
+    on_values: tuple[str, ...] = ()
     # Sub-device grouping
     node_type: str = ""
     device_name: str = ""
@@ -63,156 +72,162 @@ _ABBREVIATIONS = {"pv": "PV", "ev": "EV", "soc": "SOC", "soe": "SOE", "pcs": "PC
 
 # ── Property mappers by node type ─────────────────────────────────────────
 
+# Static property maps are built once at import and their kwargs are shared
+# by every EntitySpec created from them, so values must stay immutable.
+_CORE_PROP_MAP: dict[str, tuple[Platform, dict[str, Any]]] = {
+    "door": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Door",
+            "device_class": BinarySensorDeviceClass.TAMPER,
+            "on_values": ("OPEN",),
+        },
+    ),
+    "ethernet": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Ethernet",
+            "device_class": BinarySensorDeviceClass.CONNECTIVITY,
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "wifi": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Wi-Fi",
+            "device_class": BinarySensorDeviceClass.CONNECTIVITY,
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "cellular": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Cellular",
+            "device_class": BinarySensorDeviceClass.CONNECTIVITY,
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "software-version": (
+        Platform.SENSOR,
+        {
+            "name": "Firmware Version",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "hardware-version": (
+        Platform.SENSOR,
+        {
+            "name": "Hardware Version",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "dominant-power-source": (
+        Platform.SELECT,
+        {
+            "name": "Dominant Power Source",
+            "icon": "mdi:lightning-bolt",
+            "settable": True,
+        },
+    ),
+    "relay": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Main Relay",
+            "icon": "mdi:electric-switch",
+            "on_values": ("CLOSED",),
+        },
+    ),
+    "l1-voltage": (
+        Platform.SENSOR,
+        {
+            "name": "L1 Voltage",
+            "device_class": SensorDeviceClass.VOLTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+            "native_unit": UnitOfElectricPotential.VOLT,
+        },
+    ),
+    "l2-voltage": (
+        Platform.SENSOR,
+        {
+            "name": "L2 Voltage",
+            "device_class": SensorDeviceClass.VOLTAGE,
+            "state_class": SensorStateClass.MEASUREMENT,
+            "native_unit": UnitOfElectricPotential.VOLT,
+        },
+    ),
+    "breaker-rating": (
+        Platform.SENSOR,
+        {
+            "name": "Main Breaker Rating",
+            "device_class": SensorDeviceClass.CURRENT,
+            "native_unit": UnitOfElectricCurrent.AMPERE,
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "grid-islandable": (
+        Platform.BINARY_SENSOR,
+        {
+            "name": "Grid Islandable",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "wifi-ssid": (
+        Platform.SENSOR,
+        {
+            "name": "Wi-Fi SSID",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "vendor-cloud": (
+        Platform.SENSOR,
+        {
+            "name": "Cloud Connection",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "vendor-name": (
+        Platform.SENSOR,
+        {
+            "name": "Vendor",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "serial-number": (
+        Platform.SENSOR,
+        {
+            "name": "Serial Number",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "postal-code": (
+        Platform.SENSOR,
+        {
+            "name": "Postal Code",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+    "time-zone": (
+        Platform.SENSOR,
+        {
+            "name": "Time Zone",
+            "entity_category": EntityCategory.DIAGNOSTIC,
+        },
+    ),
+}
+
+
 def _map_core_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map core node properties to entity specs."""
     specs: list[EntitySpec] = []
 
-    prop_map: dict[str, tuple[Platform, dict[str, Any]]] = {
-        "door": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Door",
-                "device_class": BinarySensorDeviceClass.TAMPER,
-                "on_values": {"OPEN"},
-            },
-        ),
-        "ethernet": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Ethernet",
-                "device_class": BinarySensorDeviceClass.CONNECTIVITY,
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "wifi": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Wi-Fi",
-                "device_class": BinarySensorDeviceClass.CONNECTIVITY,
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "cellular": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Cellular",
-                "device_class": BinarySensorDeviceClass.CONNECTIVITY,
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "software-version": (
-            Platform.SENSOR,
-            {
-                "name": "Firmware Version",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "hardware-version": (
-            Platform.SENSOR,
-            {
-                "name": "Hardware Version",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "dominant-power-source": (
-            Platform.SELECT,
-            {
-                "name": "Dominant Power Source",
-                "icon": "mdi:lightning-bolt",
-                "settable": True,
-            },
-        ),
-        "relay": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Main Relay",
-                "icon": "mdi:electric-switch",
-                "on_values": {"CLOSED"},
-            },
-        ),
-        "l1-voltage": (
-            Platform.SENSOR,
-            {
-                "name": "L1 Voltage",
-                "device_class": SensorDeviceClass.VOLTAGE,
-                "state_class": SensorStateClass.MEASUREMENT,
-                "native_unit": UnitOfElectricPotential.VOLT,
-            },
-        ),
-        "l2-voltage": (
-            Platform.SENSOR,
-            {
-                "name": "L2 Voltage",
-                "device_class": SensorDeviceClass.VOLTAGE,
-                "state_class": SensorStateClass.MEASUREMENT,
-                "native_unit": UnitOfElectricPotential.VOLT,
-            },
-        ),
-        "breaker-rating": (
-            Platform.SENSOR,
-            {
-                "name": "Main Breaker Rating",
-                "device_class": SensorDeviceClass.CURRENT,
-                "native_unit": UnitOfElectricCurrent.AMPERE,
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "grid-islandable": (
-            Platform.BINARY_SENSOR,
-            {
-                "name": "Grid Islandable",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "wifi-ssid": (
-            Platform.SENSOR,
-            {
-                "name": "Wi-Fi SSID",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "vendor-cloud": (
-            Platform.SENSOR,
-            {
-                "name": "Cloud Connection",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "vendor-name": (
-            Platform.SENSOR,
-            {
-                "name": "Vendor",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "serial-number": (
-            Platform.SENSOR,
-            {
-                "name": "Serial Number",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "postal-code": (
-            Platform.SENSOR,
-            {
-                "name": "Postal Code",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-        "time-zone": (
-            Platform.SENSOR,
-            {
-                "name": "Time Zone",
-                "entity_category": EntityCategory.DIAGNOSTIC,
-            },
-        ),
-    }
-
     for prop_id, prop_desc in properties.items():
-        if prop_id in prop_map:
-            platform, kwargs = prop_map[prop_id]
+        if prop_id in _CORE_PROP_MAP:
+            platform, kwargs = _CORE_PROP_MAP[prop_id]
             if platform == Platform.SELECT:
                 kwargs = {**kwargs, "options": _parse_enum_format(prop_desc.get("format", ""))}
             specs.append(
@@ -220,6 +235,8 @@ def _map_core_properties(
                     platform=platform,
                     node_id=node_id,
                     property_id=prop_id,
+                    node_type=node_type,
+                    device_name=device_name,
                     **kwargs,
                 )
             )
@@ -227,9 +244,93 @@ def _map_core_properties(
     return specs
 
 
+_CIRCUIT_PROP_MAP: dict[str, tuple[Platform, dict[str, Any]]] = {
+    # settable is filled in from the description for the switch and select
+    "relay": (Platform.SWITCH, {
+        "name": "Relay",
+        "icon": "mdi:electric-switch",
+    }),
+    "shed-priority": (Platform.SELECT, {
+        "name": "Shed Priority",
+        "icon": "mdi:priority-high",
+    }),
+    "pcs-priority": (Platform.SENSOR, {
+        "name": "PCS Priority",
+        "icon": "mdi:priority-high",
+    }),
+    # Firmware bug: schema declares "kW" but values are actually in watts.
+    # Override to W regardless of what $description says.
+    # Negate: SPAN reports negative=consumption, but HA convention is
+    # positive=consumption for device_consumption stat_rate (Now tab).
+    "active-power": (Platform.SENSOR, {
+        "name": "Power",
+        "device_class": SensorDeviceClass.POWER,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "native_unit": UnitOfPower.WATT,
+        "negate": True,
+    }),
+    "current": (Platform.SENSOR, {
+        "name": "Current",
+        "device_class": SensorDeviceClass.CURRENT,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "native_unit": UnitOfElectricCurrent.AMPERE,
+    }),
+    # SPAN convention (panel perspective): "exported" = energy delivered
+    # TO circuit (consumption); "imported" = backfeed FROM circuit.
+    "imported-energy": (Platform.SENSOR, {
+        "name": "Energy Returned",
+        "device_class": SensorDeviceClass.ENERGY,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "native_unit": UnitOfEnergy.WATT_HOUR,
+    }),
+    "exported-energy": (Platform.SENSOR, {
+        "name": "Energy",
+        "device_class": SensorDeviceClass.ENERGY,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "native_unit": UnitOfEnergy.WATT_HOUR,
+    }),
+    "breaker-rating": (Platform.SENSOR, {
+        "name": "Breaker Rating",
+        "device_class": SensorDeviceClass.CURRENT,
+        "native_unit": UnitOfElectricCurrent.AMPERE,
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "space": (Platform.SENSOR, {
+        "name": "Space",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "dipole": (Platform.BINARY_SENSOR, {
+        "name": "Dipole",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "pcs-managed": (Platform.BINARY_SENSOR, {
+        "name": "PCS Managed",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "sheddable": (Platform.BINARY_SENSOR, {
+        "name": "Sheddable",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "never-backup": (Platform.BINARY_SENSOR, {
+        "name": "Never Backup",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "always-on": (Platform.BINARY_SENSOR, {
+        "name": "Always On",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "relay-requester": (Platform.SENSOR, {
+        "name": "Relay Requester",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+}
+
+
 def _map_circuit_properties(
     node_id: str,
     properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map circuit node properties to entity specs.
 
@@ -239,159 +340,80 @@ def _map_circuit_properties(
     specs: list[EntitySpec] = []
 
     for prop_id, prop_desc in properties.items():
-        settable = prop_desc.get("settable", False)
-
-        if prop_id == "relay":
-            specs.append(EntitySpec(
-                platform=Platform.SWITCH,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Relay",
-                settable=settable,
-                icon="mdi:electric-switch",
-            ))
-        elif prop_id == "shed-priority":
-            options = _parse_enum_format(prop_desc.get("format", ""))
-            specs.append(EntitySpec(
-                platform=Platform.SELECT,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Shed Priority",
-                settable=settable,
-                options=options,
-                icon="mdi:priority-high",
-            ))
-        elif prop_id == "pcs-priority":
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="PCS Priority",
-                icon="mdi:priority-high",
-            ))
-        elif prop_id == "active-power":
-            # Firmware bug: schema declares "kW" but values are actually in watts.
-            # Override to W regardless of what $description says.
-            # Negate: SPAN reports negative=consumption, but HA convention is
-            # positive=consumption for device_consumption stat_rate (Now tab).
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Power",
-                device_class=SensorDeviceClass.POWER,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit=UnitOfPower.WATT,
-                negate=True,
-            ))
-        elif prop_id == "current":
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Current",
-                device_class=SensorDeviceClass.CURRENT,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit=UnitOfElectricCurrent.AMPERE,
-            ))
-        elif prop_id in ("imported-energy", "exported-energy"):
-            # SPAN convention (panel perspective): "exported" = energy delivered
-            # TO circuit (consumption); "imported" = backfeed FROM circuit.
-            name = "Energy" if "exported" in prop_id else "Energy Returned"
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name=name,
-                device_class=SensorDeviceClass.ENERGY,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                native_unit=UnitOfEnergy.WATT_HOUR,
-            ))
-        elif prop_id == "breaker-rating":
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Breaker Rating",
-                device_class=SensorDeviceClass.CURRENT,
-                native_unit=UnitOfElectricCurrent.AMPERE,
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ))
-        elif prop_id == "space":
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Space",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ))
-        elif prop_id in (
-            "dipole", "pcs-managed", "sheddable", "never-backup", "always-on",
-        ):
-            specs.append(EntitySpec(
-                platform=Platform.BINARY_SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name=_humanize(prop_id),
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ))
-        elif prop_id == "relay-requester":
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name="Relay Requester",
-                entity_category=EntityCategory.DIAGNOSTIC,
-            ))
+        entry = _CIRCUIT_PROP_MAP.get(prop_id)
+        if entry is None:
+            continue
+        platform, kwargs = entry
+        if platform == Platform.SWITCH:
+            kwargs = {**kwargs, "settable": prop_desc.get("settable", False)}
+        elif platform == Platform.SELECT:
+            kwargs = {
+                **kwargs,
+                "settable": prop_desc.get("settable", False),
+                "options": _parse_enum_format(prop_desc.get("format", "")),
+            }
+        specs.append(EntitySpec(
+            platform=platform,
+            node_id=node_id,
+            property_id=prop_id,
+            node_type=node_type,
+            device_name=device_name,
+            **kwargs,
+        ))
 
     return specs
 
 
 def _map_power_flow_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map power-flows node properties to entity specs."""
     specs: list[EntitySpec] = []
 
     for prop_id, prop_desc in properties.items():
-        unit = prop_desc.get("unit", "")
-        name = _humanize(prop_id)
-
-        if unit in ("W", "kW") or "power" in prop_id:
-            native_unit = UnitOfPower.KILO_WATT if unit == "kW" else UnitOfPower.WATT
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name=name,
-                device_class=SensorDeviceClass.POWER,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit=native_unit,
-            ))
-        elif unit == "Wh" or "energy" in prop_id:
-            specs.append(EntitySpec(
-                platform=Platform.SENSOR,
-                node_id=node_id,
-                property_id=prop_id,
-                name=name,
-                device_class=SensorDeviceClass.ENERGY,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                native_unit=UnitOfEnergy.WATT_HOUR,
-            ))
-        else:
+        spec = _metered_sensor_spec(
+            node_id, prop_id, prop_desc.get("unit", ""), node_type, device_name,
+            allow_energy=True,
+        )
+        if spec is None:
             # Generic sensor for other power-flow properties
-            specs.append(EntitySpec(
+            spec = EntitySpec(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
-                name=name,
-            ))
+                node_type=node_type,
+                device_name=device_name,
+                name=_humanize(prop_id),
+            )
+        specs.append(spec)
 
     return specs
 
 
+# Direction-prefixed lug entity names for the property ids SPAN publishes;
+# keyed by is_upstream.  Other ids fall back to formatting.
+_LUG_PREFIXED_NAMES: dict[bool, dict[str, str]] = {
+    True: {
+        "direction": "Upstream Direction",
+        "feed": "Upstream Feed",
+        "current": "Upstream Current",
+    },
+    False: {
+        "direction": "Downstream Direction",
+        "feed": "Downstream Feed",
+        "current": "Downstream Current",
+    },
+}
+
+
 def _map_lug_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map lugs upstream/downstream node properties.
 
@@ -401,16 +423,20 @@ def _map_lug_properties(
     specs: list[EntitySpec] = []
     is_upstream = "upstream" in node_id
     direction = "Upstream" if is_upstream else "Downstream"
+    prefixed_names = _LUG_PREFIXED_NAMES[is_upstream]
 
     for prop_id, prop_desc in properties.items():
         unit = prop_desc.get("unit", "")
+        native_unit = _power_unit(prop_id, unit)
 
         if prop_id in ("direction", "feed"):
             specs.append(EntitySpec(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
-                name=f"{direction} {_humanize(prop_id)}",
+                node_type=node_type,
+                device_name=device_name,
+                name=prefixed_names[prop_id],
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
         elif prop_id == "imported-energy":
@@ -420,6 +446,8 @@ def _map_lug_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 device_class=SensorDeviceClass.ENERGY,
                 state_class=SensorStateClass.TOTAL_INCREASING,
@@ -431,18 +459,21 @@ def _map_lug_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 device_class=SensorDeviceClass.ENERGY,
                 state_class=SensorStateClass.TOTAL_INCREASING,
                 native_unit=UnitOfEnergy.WATT_HOUR,
             ))
-        elif unit in ("W", "kW") or "power" in prop_id:
-            native_unit = UnitOfPower.KILO_WATT if unit == "kW" else UnitOfPower.WATT
+        elif native_unit is not None:
             name = "Power" if is_upstream else "Downstream Power"
             specs.append(EntitySpec(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 device_class=SensorDeviceClass.POWER,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -453,7 +484,12 @@ def _map_lug_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
-                name=f"{direction} {_humanize(prop_id)}",
+                node_type=node_type,
+                device_name=device_name,
+                name=(
+                    prefixed_names.get(prop_id)
+                    or f"{direction} {_humanize(prop_id)}"
+                ),
                 device_class=SensorDeviceClass.CURRENT,
                 state_class=SensorStateClass.MEASUREMENT,
                 native_unit=UnitOfElectricCurrent.AMPERE,
@@ -462,8 +498,63 @@ def _map_lug_properties(
     return specs
 
 
+_BESS_PROP_MAP: dict[str, tuple[Platform, dict[str, Any]]] = {
+    "soc": (Platform.SENSOR, {
+        "name": "State of Charge",
+        "device_class": SensorDeviceClass.BATTERY,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "native_unit": "%",
+    }),
+    "soe": (Platform.SENSOR, {
+        "name": "State of Energy",
+        "device_class": SensorDeviceClass.ENERGY_STORAGE,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "native_unit": UnitOfEnergy.KILO_WATT_HOUR,
+    }),
+    "connected": (Platform.BINARY_SENSOR, {
+        "name": "Connected",
+        "device_class": BinarySensorDeviceClass.CONNECTIVITY,
+    }),
+    "grid-state": (Platform.SENSOR, {
+        "name": "Grid State",
+        "icon": "mdi:transmission-tower",
+    }),
+    "vendor-name": (Platform.SENSOR, {
+        "name": "Vendor",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "product-name": (Platform.SENSOR, {
+        "name": "Product",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "model": (Platform.SENSOR, {
+        "name": "Model",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "serial-number": (Platform.SENSOR, {
+        "name": "Serial Number",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "software-version": (Platform.SENSOR, {
+        "name": "Firmware Version",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "relative-position": (Platform.SENSOR, {
+        "name": "Relative Position",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "feed": (Platform.SENSOR, {
+        "name": "Feed Circuit",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+}
+
+
 def _map_bess_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map battery energy storage (bess) node properties.
 
@@ -471,64 +562,15 @@ def _map_bess_properties(
     """
     specs: list[EntitySpec] = []
 
-    prop_map: dict[str, tuple[Platform, dict[str, Any]]] = {
-        "soc": (Platform.SENSOR, {
-            "name": "State of Charge",
-            "device_class": SensorDeviceClass.BATTERY,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "native_unit": "%",
-        }),
-        "soe": (Platform.SENSOR, {
-            "name": "State of Energy",
-            "device_class": SensorDeviceClass.ENERGY_STORAGE,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "native_unit": UnitOfEnergy.KILO_WATT_HOUR,
-        }),
-        "connected": (Platform.BINARY_SENSOR, {
-            "name": "Connected",
-            "device_class": BinarySensorDeviceClass.CONNECTIVITY,
-        }),
-        "grid-state": (Platform.SENSOR, {
-            "name": "Grid State",
-            "icon": "mdi:transmission-tower",
-        }),
-        "vendor-name": (Platform.SENSOR, {
-            "name": "Vendor",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "product-name": (Platform.SENSOR, {
-            "name": "Product",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "model": (Platform.SENSOR, {
-            "name": "Model",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "serial-number": (Platform.SENSOR, {
-            "name": "Serial Number",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "software-version": (Platform.SENSOR, {
-            "name": "Firmware Version",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "relative-position": (Platform.SENSOR, {
-            "name": "Relative Position",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "feed": (Platform.SENSOR, {
-            "name": "Feed Circuit",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-    }
-
     for prop_id, prop_desc in properties.items():
-        if prop_id in prop_map:
-            platform, kwargs = prop_map[prop_id]
+        if prop_id in _BESS_PROP_MAP:
+            platform, kwargs = _BESS_PROP_MAP[prop_id]
             specs.append(EntitySpec(
                 platform=platform,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 **kwargs,
             ))
         elif prop_id == "nameplate-capacity":
@@ -538,30 +580,54 @@ def _map_bess_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name="Nameplate Capacity",
                 device_class=SensorDeviceClass.ENERGY_STORAGE,
                 native_unit=native_unit,
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
-        else:
-            unit = prop_desc.get("unit", "")
-            if unit in ("W", "kW") or "power" in prop_id:
-                native_unit = UnitOfPower.KILO_WATT if unit == "kW" else UnitOfPower.WATT
-                specs.append(EntitySpec(
-                    platform=Platform.SENSOR,
-                    node_id=node_id,
-                    property_id=prop_id,
-                    name=_humanize(prop_id),
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    native_unit=native_unit,
-                ))
+        elif spec := _metered_sensor_spec(
+            node_id, prop_id, prop_desc.get("unit", ""), node_type, device_name
+        ):
+            specs.append(spec)
 
     return specs
 
 
+_PV_PROP_MAP: dict[str, tuple[Platform, dict[str, Any]]] = {
+    "vendor-name": (Platform.SENSOR, {
+        "name": "Vendor",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "product-name": (Platform.SENSOR, {
+        "name": "Product",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "serial-number": (Platform.SENSOR, {
+        "name": "Serial Number",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "software-version": (Platform.SENSOR, {
+        "name": "Firmware Version",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "relative-position": (Platform.SENSOR, {
+        "name": "Relative Position",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "feed": (Platform.SENSOR, {
+        "name": "Feed Circuit",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+}
+
+
 def _map_pv_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map PV (solar) node properties.
 
@@ -569,40 +635,15 @@ def _map_pv_properties(
     """
     specs: list[EntitySpec] = []
 
-    prop_map: dict[str, tuple[Platform, dict[str, Any]]] = {
-        "vendor-name": (Platform.SENSOR, {
-            "name": "Vendor",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "product-name": (Platform.SENSOR, {
-            "name": "Product",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "serial-number": (Platform.SENSOR, {
-            "name": "Serial Number",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "software-version": (Platform.SENSOR, {
-            "name": "Firmware Version",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "relative-position": (Platform.SENSOR, {
-            "name": "Relative Position",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "feed": (Platform.SENSOR, {
-            "name": "Feed Circuit",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-    }
-
     for prop_id, prop_desc in properties.items():
-        if prop_id in prop_map:
-            platform, kwargs = prop_map[prop_id]
+        if prop_id in _PV_PROP_MAP:
+            platform, kwargs = _PV_PROP_MAP[prop_id]
             specs.append(EntitySpec(
                 platform=platform,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 **kwargs,
             ))
         elif prop_id == "nameplate-capacity":
@@ -612,41 +653,69 @@ def _map_pv_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name="Nameplate Capacity",
                 device_class=SensorDeviceClass.POWER,
                 native_unit=native_unit,
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
-        else:
-            unit = prop_desc.get("unit", "")
-            name = _humanize(prop_id)
-            if unit in ("W", "kW") or "power" in prop_id:
-                native_unit = UnitOfPower.KILO_WATT if unit == "kW" else UnitOfPower.WATT
-                specs.append(EntitySpec(
-                    platform=Platform.SENSOR,
-                    node_id=node_id,
-                    property_id=prop_id,
-                    name=name,
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    native_unit=native_unit,
-                ))
-            elif unit == "Wh" or "energy" in prop_id:
-                specs.append(EntitySpec(
-                    platform=Platform.SENSOR,
-                    node_id=node_id,
-                    property_id=prop_id,
-                    name=name,
-                    device_class=SensorDeviceClass.ENERGY,
-                    state_class=SensorStateClass.TOTAL_INCREASING,
-                    native_unit=UnitOfEnergy.WATT_HOUR,
-                ))
+        elif spec := _metered_sensor_spec(
+            node_id, prop_id, prop_desc.get("unit", ""), node_type, device_name,
+            allow_energy=True,
+        ):
+            specs.append(spec)
 
     return specs
 
 
+_EVSE_PROP_MAP: dict[str, tuple[Platform, dict[str, Any]]] = {
+    "status": (Platform.SENSOR, {
+        "name": "Status",
+        "icon": "mdi:ev-station",
+    }),
+    "lock-state": (Platform.SENSOR, {
+        "name": "Lock State",
+        "icon": "mdi:lock",
+    }),
+    "advertised-current": (Platform.SENSOR, {
+        "name": "Advertised Current",
+        "device_class": SensorDeviceClass.CURRENT,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "native_unit": UnitOfElectricCurrent.AMPERE,
+    }),
+    "vendor-name": (Platform.SENSOR, {
+        "name": "Vendor",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "product-name": (Platform.SENSOR, {
+        "name": "Product",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "part-number": (Platform.SENSOR, {
+        "name": "Part Number",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "serial-number": (Platform.SENSOR, {
+        "name": "Serial Number",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "software-version": (Platform.SENSOR, {
+        "name": "Firmware Version",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+    "feed": (Platform.SENSOR, {
+        "name": "Feed Circuit",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+    }),
+}
+
+
 def _map_evse_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map EV charger (evse) node properties.
 
@@ -654,76 +723,30 @@ def _map_evse_properties(
     """
     specs: list[EntitySpec] = []
 
-    prop_map: dict[str, tuple[Platform, dict[str, Any]]] = {
-        "status": (Platform.SENSOR, {
-            "name": "Status",
-            "icon": "mdi:ev-station",
-        }),
-        "lock-state": (Platform.SENSOR, {
-            "name": "Lock State",
-            "icon": "mdi:lock",
-        }),
-        "advertised-current": (Platform.SENSOR, {
-            "name": "Advertised Current",
-            "device_class": SensorDeviceClass.CURRENT,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "native_unit": UnitOfElectricCurrent.AMPERE,
-        }),
-        "vendor-name": (Platform.SENSOR, {
-            "name": "Vendor",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "product-name": (Platform.SENSOR, {
-            "name": "Product",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "part-number": (Platform.SENSOR, {
-            "name": "Part Number",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "serial-number": (Platform.SENSOR, {
-            "name": "Serial Number",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "software-version": (Platform.SENSOR, {
-            "name": "Firmware Version",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-        "feed": (Platform.SENSOR, {
-            "name": "Feed Circuit",
-            "entity_category": EntityCategory.DIAGNOSTIC,
-        }),
-    }
-
     for prop_id, prop_desc in properties.items():
-        if prop_id in prop_map:
-            platform, kwargs = prop_map[prop_id]
+        if prop_id in _EVSE_PROP_MAP:
+            platform, kwargs = _EVSE_PROP_MAP[prop_id]
             specs.append(EntitySpec(
                 platform=platform,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 **kwargs,
             ))
-        else:
-            unit = prop_desc.get("unit", "")
-            name = _humanize(prop_id)
-            if unit in ("W", "kW") or "power" in prop_id:
-                native_unit = UnitOfPower.KILO_WATT if unit == "kW" else UnitOfPower.WATT
-                specs.append(EntitySpec(
-                    platform=Platform.SENSOR,
-                    node_id=node_id,
-                    property_id=prop_id,
-                    name=name,
-                    device_class=SensorDeviceClass.POWER,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    native_unit=native_unit,
-                ))
+        elif spec := _metered_sensor_spec(
+            node_id, prop_id, prop_desc.get("unit", ""), node_type, device_name
+        ):
+            specs.append(spec)
 
     return specs
 
 
 def _map_pcs_properties(
-    node_id: str, properties: dict[str, Any]
+    node_id: str,
+    properties: dict[str, Any],
+    node_type: str = "",
+    device_name: str = "",
 ) -> list[EntitySpec]:
     """Map Power Control System (PCS) node properties."""
     specs: list[EntitySpec] = []
@@ -738,6 +761,8 @@ def _map_pcs_properties(
                 platform=Platform.BINARY_SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
@@ -746,6 +771,8 @@ def _map_pcs_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 device_class=SensorDeviceClass.CURRENT,
                 state_class=SensorStateClass.MEASUREMENT,
@@ -757,6 +784,8 @@ def _map_pcs_properties(
                 platform=Platform.SENSOR,
                 node_id=node_id,
                 property_id=prop_id,
+                node_type=node_type,
+                device_name=device_name,
                 name=name,
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
@@ -779,6 +808,17 @@ _NODE_TYPE_MAPPERS: dict[str, Any] = {
     "energy.ebus.device.pcs": _map_pcs_properties,
 }
 
+# Node type → (mapper, is sub-device, sub-device type label), so each node
+# needs a single lookup during parsing
+_NODE_TYPE_DISPATCH: dict[str, tuple[Any, bool, str | None]] = {
+    node_type: (
+        mapper,
+        node_type in _SUB_DEVICE_TYPES,
+        _NODE_TYPE_LABELS.get(node_type),
+    )
+    for node_type, mapper in _NODE_TYPE_MAPPERS.items()
+}
+
 
 def entities_from_description(
     description: dict[str, Any],
@@ -790,7 +830,7 @@ def entities_from_description(
     in the panel's description — forward-compatible with new panel features.
 
     Sub-device node types (circuits, BESS, PV, EVSE) get ``node_type`` and
-    ``device_name`` stamped on each returned spec so the entity base can
+    ``device_name`` passed through to their mapper and set on each spec so the entity base can
     create child devices via ``via_device``.
 
     Args:
@@ -799,43 +839,47 @@ def entities_from_description(
             values (e.g. circuit names).
 
     """
-    from .util import _NODE_TYPE_LABELS, _SUB_DEVICE_TYPES  # noqa: PLC0415
-
     specs: list[EntitySpec] = []
     nodes = description.get("nodes", {})
+    dispatch_get = _NODE_TYPE_DISPATCH.get
+    # Circuit device names resolved in this parse, reused for generation specs
+    circuit_device_names: dict[str, str] = {}
 
     for node_id, node_desc in nodes.items():
-        properties = node_desc.get("properties", {})
+        # Missing and empty property dicts both skip without building a default
+        properties = node_desc.get("properties")
         if not properties:
             continue
 
+        # Every spec for this node (and each re-parse) shares one node_id string
+        node_id = sys.intern(node_id)
         node_type = node_desc.get("type", "")
-        mapper = _NODE_TYPE_MAPPERS.get(node_type)
+        dispatch = dispatch_get(node_type)
 
-        if mapper is None:
+        if dispatch is None:
             _LOGGER.debug("No mapper for node %s (type=%s), skipping", node_id, node_type)
             continue
 
-        new_specs = mapper(node_id, properties)
+        mapper, is_sub_device, type_label = dispatch
 
-        # Stamp sub-device info so entities can create child devices
-        if node_type in _SUB_DEVICE_TYPES:
+        # Resolve sub-device info up front so the mapper builds complete specs
+        if is_sub_device:
             if node_type == "energy.ebus.device.circuit":
                 circuit_name = None
                 if panel is not None:
                     circuit_name = panel.get_property_value(node_id, "name")
                 dev_name = circuit_name or f"Circuit {node_id[:6]}"
+                circuit_device_names[node_id] = dev_name
             else:
-                type_label = _NODE_TYPE_LABELS.get(node_type, _humanize(node_id))
+                type_label = type_label or _humanize(node_id)
                 if panel is not None:
                     short_serial = panel.serial_number.rsplit("-", 1)[-1]
                     dev_name = f"{short_serial} {type_label}"
                 else:
                     dev_name = type_label
-
-            for spec in new_specs:
-                spec.node_type = node_type
-                spec.device_name = dev_name
+            new_specs = mapper(node_id, properties, node_type=node_type, device_name=dev_name)
+        else:
+            new_specs = mapper(node_id, properties)
 
         specs.extend(new_specs)
 
@@ -855,6 +899,10 @@ def entities_from_description(
         for circuit_id in pv_feed_circuits:
             circuit_desc = nodes.get(circuit_id, {})
             if "active-power" in circuit_desc.get("properties", {}):
+                dev_name = circuit_device_names.get(circuit_id)
+                if dev_name is None:
+                    circuit_name = panel.get_property_value(circuit_id, "name")
+                    dev_name = circuit_name or f"Circuit {circuit_id[:6]}"
                 gen_spec = EntitySpec(
                     platform=Platform.SENSOR,
                     node_id=circuit_id,
@@ -864,10 +912,9 @@ def entities_from_description(
                     device_class=SensorDeviceClass.POWER,
                     state_class=SensorStateClass.MEASUREMENT,
                     native_unit=UnitOfPower.WATT,
+                    node_type="energy.ebus.device.circuit",
+                    device_name=dev_name,
                 )
-                gen_spec.node_type = "energy.ebus.device.circuit"
-                circuit_name = panel.get_property_value(circuit_id, "name")
-                gen_spec.device_name = circuit_name or f"Circuit {circuit_id[:6]}"
                 specs.append(gen_spec)
 
     return specs
@@ -875,17 +922,80 @@ def entities_from_description(
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 
-def _parse_enum_format(fmt: str) -> list[str]:
-    """Parse Homie enum format string ('val1,val2,val3') into options list."""
-    if not fmt:
-        return []
-    return [v.strip() for v in fmt.split(",") if v.strip()]
+# Description power units → HA units
+_POWER_UNITS = {"W": UnitOfPower.WATT, "kW": UnitOfPower.KILO_WATT}
+
+
+def _power_unit(prop_id: str, unit: str) -> str | None:
+    """Return the HA unit for a power property, or None if it is not power.
+
+    The declared unit decides first; a "power" property id without a
+    power unit falls back to watts.
+    """
+    native_unit = _POWER_UNITS.get(unit)
+    if native_unit is None and "power" in prop_id:
+        return UnitOfPower.WATT
+    return native_unit
+
+
+def _metered_sensor_spec(
+    node_id: str,
+    prop_id: str,
+    unit: str,
+    node_type: str,
+    device_name: str,
+    *,
+    allow_energy: bool = False,
+) -> EntitySpec | None:
+    """Build the power (or, if allowed, energy) sensor spec for a property.
+
+    Shared fallback for node types whose remaining properties are
+    classified by unit.  Returns None when the property is neither.
+    """
+    native_unit = _power_unit(prop_id, unit)
+    if native_unit is not None:
+        return EntitySpec(
+            platform=Platform.SENSOR,
+            node_id=node_id,
+            property_id=prop_id,
+            node_type=node_type,
+            device_name=device_name,
+            name=_humanize(prop_id),
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit=native_unit,
+        )
+    if allow_energy and (unit == "Wh" or "energy" in prop_id):
+        return EntitySpec(
+            platform=Platform.SENSOR,
+            node_id=node_id,
+            property_id=prop_id,
+            node_type=node_type,
+            device_name=device_name,
+            name=_humanize(prop_id),
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            native_unit=UnitOfEnergy.WATT_HOUR,
+        )
+    return None
+
+
+@lru_cache(maxsize=64)
+def _parse_enum_format(fmt: str) -> tuple[str, ...]:
+    """Parse Homie enum format string ('val1,val2,val3') into options.
+
+    Cached and immutable: the same few format strings recur on every parse,
+    and the returned tuple is shared between specs.
+    """
+    return tuple(v for part in fmt.split(",") if (v := part.strip()))
 
 
+@lru_cache(maxsize=256)
 def _humanize(prop_id: str) -> str:
     """Convert property-id to human-readable name.
 
-    Handles known abbreviations (PV, EV, SOC, etc.).
+    Handles known abbreviations (PV, EV, SOC, etc.).  Cached: property ids
+    come from a small fixed vocabulary that repeats across nodes.
     """
     parts = prop_id.replace("_", "-").split("-")
     return " ".join(_ABBREVIATIONS.get(p, p.title()) for p in parts)
@@ -13,6 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_base import SpanEbusEntity
+from .models import SpanPanelEntry
 from .node_mappers import EntitySpec
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,18 +25,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SPAN select entities from a config entry."""
-    panel = hass.data[DOMAIN][entry.entry_id]["panel"]
-    entity_specs: list[EntitySpec] = hass.data[DOMAIN][entry.entry_id]["entity_specs"]
+    data: SpanPanelEntry = hass.data[DOMAIN].panels[entry.entry_id]
+    panel = data.panel
+    entity_specs = data.specs_by_platform.get(Platform.SELECT)
+    if not entity_specs:
+        return
 
-    entities = [
-        SpanEbusSelect(panel, spec)
-        for spec in entity_specs
-        if spec.platform == Platform.SELECT
-    ]
-
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.debug("Added %d select entities for %s", len(entities), panel.serial_number)
+    async_add_entities([SpanEbusSelect(panel, spec) for spec in entity_specs])
+    _LOGGER.debug("Added %d select entities for %s", len(entity_specs), panel.serial_number)
 
 
 class SpanEbusSelect(SpanEbusEntity, SelectEntity):
@@ -44,13 +41,15 @@ class SpanEbusSelect(SpanEbusEntity, SelectEntity):
     def __init__(self, panel: Any, spec: EntitySpec) -> None:
         """Initialize the select."""
         super().__init__(panel=panel, spec=spec)
-        self._attr_options = spec.options
+        self._attr_options = list(spec.options)
+        # Hashed membership for per-message validation
+        self._known_options = frozenset(spec.options)
         if spec.icon:
             self._attr_icon = spec.icon
 
     def _update_from_value(self, value: str) -> None:
         """Update select state from a raw MQTT value."""
-        if value in self._attr_options:
+        if value in self._known_options:
             self._attr_current_option = value
         else:
             _LOGGER.warning(
@@ -61,6 +60,10 @@ class SpanEbusSelect(SpanEbusEntity, SelectEntity):
             )
             self._attr_current_option = value
 
+    def _state_fingerprint(self) -> tuple:
+        """Return the selected option."""
+        return (self._attr_current_option,)
+
     async def async_select_option(self, option: str) -> None:
         """Send selected option to the panel."""
         self._panel.set_property(self._node_id, self._property_id, option)
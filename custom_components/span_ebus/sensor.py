@@ -13,10 +13,21 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_base import SpanEbusEntity
+from .models import SpanPanelEntry
 from .node_mappers import EntitySpec
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device classes whose raw MQTT values are parsed as floats
+_NUMERIC_DEVICE_CLASSES = frozenset({
+    SensorDeviceClass.POWER,
+    SensorDeviceClass.ENERGY,
+    SensorDeviceClass.BATTERY,
+    SensorDeviceClass.CURRENT,
+    SensorDeviceClass.VOLTAGE,
+    SensorDeviceClass.ENERGY_STORAGE,
+})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,18 +35,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SPAN sensor entities from a config entry."""
-    panel = hass.data[DOMAIN][entry.entry_id]["panel"]
-    entity_specs: list[EntitySpec] = hass.data[DOMAIN][entry.entry_id]["entity_specs"]
-
-    entities = [
-        SpanEbusSensor(panel, spec)
-        for spec in entity_specs
-        if spec.platform == Platform.SENSOR
-    ]
+    data: SpanPanelEntry = hass.data[DOMAIN].panels[entry.entry_id]
+    panel = data.panel
+    entity_specs = data.specs_by_platform.get(Platform.SENSOR)
+    if not entity_specs:
+        return
 
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.debug("Added %d sensor entities for %s", len(entities), panel.serial_number)
+    async_add_entities([SpanEbusSensor(panel, spec) for spec in entity_specs])
+    _LOGGER.debug("Added %d sensor entities for %s", len(entity_specs), panel.serial_number)
 
 
 class SpanEbusSensor(SpanEbusEntity, SensorEntity):
@@ -53,19 +60,13 @@ class SpanEbusSensor(SpanEbusEntity, SensorEntity):
         if spec.icon:
             self._attr_icon = spec.icon
         self._counter_decrease_suppressed = False
-
-    _NUMERIC_DEVICE_CLASSES = {
-        SensorDeviceClass.POWER,
-        SensorDeviceClass.ENERGY,
-        SensorDeviceClass.BATTERY,
-        SensorDeviceClass.CURRENT,
-        SensorDeviceClass.VOLTAGE,
-        SensorDeviceClass.ENERGY_STORAGE,
-    }
+        # Resolve the parse path once instead of per MQTT message
+        self._numeric = spec.device_class in _NUMERIC_DEVICE_CLASSES
+        self._feed = spec.property_id == "feed"
 
     def _update_from_value(self, value: str) -> None:
         """Update sensor state from a raw MQTT value."""
-        if self.device_class in self._NUMERIC_DEVICE_CLASSES:
+        if self._numeric:
             try:
                 numeric = float(value)
                 if self._spec.negate:
@@ -100,7 +101,7 @@ class SpanEbusSensor(SpanEbusEntity, SensorEntity):
                 self._attr_native_value = numeric
             except (ValueError, TypeError):
                 self._attr_native_value = None
-        elif self._property_id == "feed":
+        elif self._feed:
             # Feed values are circuit node ID references — resolve to name
             name = self._panel.get_property_value(value, "name")
             if name:
@@ -110,3 +111,11 @@ class SpanEbusSensor(SpanEbusEntity, SensorEntity):
                 self._attr_native_value = value
         else:
             self._attr_native_value = value
+
+    def _state_fingerprint(self) -> tuple:
+        """Return the sensor's native value and attributes."""
+        # _attr_extra_state_attributes is only set once a feed name resolves
+        return (
+            self._attr_native_value,
+            getattr(self, "_attr_extra_state_attributes", None),
+        )
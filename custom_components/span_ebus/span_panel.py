@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable
+import itertools
 import logging
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
 from ebus_sdk.homie import Controller, DiscoveredDevice
 from homeassistant.core import HomeAssistant, callback
 
-from .const import EBUS_HOMIE_DOMAIN, MQTT_QOS
+from .const import EBUS_HOMIE_DOMAIN, MQTT_QOS, STATE_WRITE_DELAY
+
+if TYPE_CHECKING:
+    from .entity_base import SpanEbusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 # Callback type for entity property updates: (value: str) -> None
 PropertyCallback = Callable[[str], None]
 
+# Callback type for property updates on any node: (node_id: str, value: str) -> None
+NodePropertyCallback = Callable[[str, str], None]
+
 # Callback type for availability changes: (available: bool) -> None
 AvailabilityCallback = Callable[[bool], None]
 
@@ -49,14 +58,33 @@ class SpanPanel:
         # Event set when device reaches "ready" state (all property values available)
         self.device_ready = asyncio.Event()
 
-        # Entity callback registrations: {(node_id, property_id): [callback, ...]}
-        self._property_callbacks: dict[tuple[str, str], list[PropertyCallback]] = {}
+        # Entity callback registrations: {(node_id, property_id): (callback, ...)}
+        # Tuples are replaced, never mutated, on (un)registration, so dispatch
+        # iterates them without taking a snapshot copy per message.
+        self._property_callbacks: dict[tuple[str, str], tuple[PropertyCallback, ...]] = {}
+
+        # Wildcard registrations matching any node: {property_id: (callback, ...)}
+        self._node_property_callbacks: dict[str, tuple[NodePropertyCallback, ...]] = {}
 
-        # Availability callbacks from entities
-        self._availability_callbacks: list[AvailabilityCallback] = []
+        # Availability callbacks from entities, keyed by registration token so
+        # each entity's unregister is O(1) during bulk teardown
+        self._availability_callbacks: dict[int, AvailabilityCallback] = {}
 
         # Ready callbacks — fired on every ready transition (not just first)
-        self._ready_callbacks: list[Callable[[], None]] = []
+        self._ready_callbacks: dict[int, Callable[[], None]] = {}
+
+        self._callback_tokens = itertools.count()
+
+        # Property updates queued on the paho thread, drained on the HA loop.
+        # One call_soon_threadsafe wakeup covers every update queued before
+        # the drain runs.
+        self._pending_updates: deque[tuple[tuple[str, str], str]] = deque()
+        self._drain_scheduled = False
+        self._pending_lock = threading.Lock()
+
+        # Entities with a pending state write, flushed together by one timer
+        self._dirty_entities: set[SpanEbusEntity] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     @property
     def available(self) -> bool:
@@ -83,12 +111,29 @@ class SpanPanel:
         Returns an unregister function.
         """
         key = (node_id, property_id)
-        self._property_callbacks.setdefault(key, []).append(cb)
+        self._property_callbacks[key] = self._property_callbacks.get(key, ()) + (cb,)
 
         def unregister() -> None:
-            cbs = self._property_callbacks.get(key)
-            if cbs and cb in cbs:
-                cbs.remove(cb)
+            _remove_callback(self._property_callbacks, key, cb)
+
+        return unregister
+
+    def register_node_property_callback(
+        self, property_id: str, cb: NodePropertyCallback
+    ) -> Callable[[], None]:
+        """Register a callback for a property update on any node.
+
+        The callback receives (node_id, value), so one registration can
+        replace a per-node callback for every node carrying the property.
+
+        Returns an unregister function.
+        """
+        self._node_property_callbacks[property_id] = (
+            self._node_property_callbacks.get(property_id, ()) + (cb,)
+        )
+
+        def unregister() -> None:
+            _remove_callback(self._node_property_callbacks, property_id, cb)
 
         return unregister
 
@@ -99,11 +144,11 @@ class SpanPanel:
 
         Returns an unregister function.
         """
-        self._availability_callbacks.append(cb)
+        token = next(self._callback_tokens)
+        self._availability_callbacks[token] = cb
 
         def unregister() -> None:
-            if cb in self._availability_callbacks:
-                self._availability_callbacks.remove(cb)
+            self._availability_callbacks.pop(token, None)
 
         return unregister
 
@@ -115,20 +160,52 @@ class SpanPanel:
 
         Returns an unregister function.
         """
-        self._ready_callbacks.append(cb)
+        token = next(self._callback_tokens)
+        self._ready_callbacks[token] = cb
 
         def unregister() -> None:
-            if cb in self._ready_callbacks:
-                self._ready_callbacks.remove(cb)
+            self._ready_callbacks.pop(token, None)
 
         return unregister
 
+    def mark_dirty(self, entity: SpanEbusEntity) -> None:
+        """Queue an entity's state write for the next batched flush.
+
+        The first entity marked after a flush starts a single timer; every
+        entity marked before it fires is written in the same pass.
+        """
+        self._dirty_entities.add(entity)
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                STATE_WRITE_DELAY, self._flush_dirty
+            )
+
+    def discard_dirty(self, entity: SpanEbusEntity) -> None:
+        """Drop a queued state write (entity removal)."""
+        self._dirty_entities.discard(entity)
+
     def get_property_value(self, node_id: str, property_id: str) -> str | None:
         """Get the current value of a property."""
         if self._device is None:
             return None
         return self._device.get_property(node_id, property_id)
 
+    def snapshot_property(self, property_id: str) -> dict[str, str | None]:
+        """Return {node_id: value} for one property across all nodes.
+
+        Takes a single pass over the device's property store instead of one
+        get_property_value() call per node.  Nodes that have not yet
+        published the property map to None.
+        """
+        if self._device is None:
+            return {}
+        # list() copies the items in one C-level call, so concurrent inserts
+        # from the paho-mqtt thread cannot break the iteration.
+        return {
+            node_id: props.get(property_id)
+            for node_id, props in list(self._device.properties.items())
+        }
+
     def set_property(self, node_id: str, property_id: str, value: str) -> bool:
         """Send a command to set a property value on the panel."""
         if self._controller is None or self._device is None:
@@ -163,8 +240,15 @@ class SpanPanel:
             self._controller = None
         self._device = None
         self._available = False
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._dirty_entities.clear()
+        with self._pending_lock:
+            self._pending_updates.clear()
         # Release callback registrations to break reference cycles
         self._property_callbacks.clear()
+        self._node_property_callbacks.clear()
         self._availability_callbacks.clear()
         self._ready_callbacks.clear()
 
@@ -203,12 +287,16 @@ class SpanPanel:
             return
 
         key = (node_id, property_id)
-        callbacks = self._property_callbacks.get(key, [])
-        if callbacks:
-            # Bridge to HA event loop
-            self.hass.loop.call_soon_threadsafe(
-                self._dispatch_property_update, key, value
-            )
+        if self._property_callbacks.get(key) or self._node_property_callbacks.get(
+            property_id
+        ):
+            # Bridge to HA event loop, waking it only if no drain is pending
+            with self._pending_lock:
+                self._pending_updates.append((key, value))
+                if self._drain_scheduled:
+                    return
+                self._drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._drain_pending_updates)
 
     def _on_device_state_changed(
         self,
@@ -241,17 +329,49 @@ class SpanPanel:
         self, key: tuple[str, str], value: str
     ) -> None:
         """Dispatch property update to registered entity callbacks (HA event loop)."""
-        # Snapshot the list to avoid issues if callbacks are added/removed during iteration
-        for cb in list(self._property_callbacks.get(key, [])):
+        # Registration swaps in new tuples, so these are stable snapshots as-is
+        for cb in self._property_callbacks.get(key, ()):
             try:
                 cb(value)
             except Exception:
                 _LOGGER.exception("Error in property callback for %s", key)
+        node_id, property_id = key
+        for node_cb in self._node_property_callbacks.get(property_id, ()):
+            try:
+                node_cb(node_id, value)
+            except Exception:
+                _LOGGER.exception("Error in property callback for %s", key)
+
+    @callback
+    def _drain_pending_updates(self) -> None:
+        """Dispatch the latest queued value of each property (HA event loop)."""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, deque()
+            self._drain_scheduled = False
+        # Last write wins within a burst (e.g. retained values replayed on
+        # reconnect): superseded values for the same property are dropped.
+        dispatch = self._dispatch_property_update
+        for key, value in dict(pending).items():
+            dispatch(key, value)
+
+    @callback
+    def _flush_dirty(self) -> None:
+        """Write state for every entity marked dirty since the last flush."""
+        self._flush_handle = None
+        dirty, self._dirty_entities = self._dirty_entities, set()
+        for entity in dirty:
+            try:
+                entity._flush_state()
+            except Exception:
+                _LOGGER.exception("Error writing state for %s", entity.entity_id)
 
     @callback
     def _dispatch_availability(self, available: bool) -> None:
         """Dispatch availability change to registered entity callbacks (HA event loop)."""
-        for cb in list(self._availability_callbacks):
+        if not self._availability_callbacks:
+            return
+        # Snapshot: a callback may unregister itself (entity removal) mid-dispatch
+        for cb in list(self._availability_callbacks.values()):
             try:
                 cb(available)
             except Exception:
@@ -260,8 +380,23 @@ class SpanPanel:
     @callback
     def _dispatch_ready(self) -> None:
         """Dispatch ready notification to registered callbacks (HA event loop)."""
-        for cb in list(self._ready_callbacks):
+        if not self._ready_callbacks:
+            return
+        for cb in list(self._ready_callbacks.values()):
             try:
                 cb()
             except Exception:
                 _LOGGER.exception("Error in ready callback")
+
+
+def _remove_callback(registry: dict[Any, tuple], key: Any, cb: Callable) -> None:
+    """Drop the first registration of cb under key, replacing the tuple."""
+    cbs = registry.get(key)
+    if not cbs or cb not in cbs:
+        return
+    idx = cbs.index(cb)
+    remaining = cbs[:idx] + cbs[idx + 1:]
+    if remaining:
+        registry[key] = remaining
+    else:
+        del registry[key]
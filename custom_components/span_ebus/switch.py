@@ -13,6 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_base import SpanEbusEntity
+from .models import SpanPanelEntry
 from .node_mappers import EntitySpec
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,23 +25,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up SPAN switch entities from a config entry."""
-    panel = hass.data[DOMAIN][entry.entry_id]["panel"]
-    entity_specs: list[EntitySpec] = hass.data[DOMAIN][entry.entry_id]["entity_specs"]
+    data: SpanPanelEntry = hass.data[DOMAIN].panels[entry.entry_id]
+    panel = data.panel
+    entity_specs = data.specs_by_platform.get(Platform.SWITCH)
+    if not entity_specs:
+        return
 
-    entities = [
-        SpanEbusSwitch(panel, spec)
-        for spec in entity_specs
-        if spec.platform == Platform.SWITCH
-    ]
-
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.debug("Added %d switch entities for %s", len(entities), panel.serial_number)
+    async_add_entities([SpanEbusSwitch(panel, spec) for spec in entity_specs])
+    _LOGGER.debug("Added %d switch entities for %s", len(entity_specs), panel.serial_number)
 
 
 class SpanEbusSwitch(SpanEbusEntity, SwitchEntity):
     """A switch entity for a SPAN Panel circuit relay."""
 
+    # State flips are rare and should reach HA immediately
+    _coalesce_writes = False
+
     def __init__(self, panel: Any, spec: EntitySpec) -> None:
         """Initialize the switch."""
         super().__init__(panel=panel, spec=spec)
@@ -51,6 +51,10 @@ class SpanEbusSwitch(SpanEbusEntity, SwitchEntity):
         """Update switch state from relay value (CLOSED=on, OPEN=off)."""
         self._attr_is_on = value.upper() == "CLOSED"
 
+    def _state_fingerprint(self) -> tuple:
+        """Return the switch's on/off state."""
+        return (self._attr_is_on,)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the relay on (CLOSED)."""
         self._panel.set_property(self._node_id, self._property_id, "CLOSED")
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 
 # Node types that become child devices of the panel
-_SUB_DEVICE_TYPES = {
+_SUB_DEVICE_TYPES = frozenset({
     "energy.ebus.device.circuit",
     "energy.ebus.device.bess",
     "energy.ebus.device.pv",
     "energy.ebus.device.evse",
     "energy.ebus.device.power-flows",
-}
+})
 
 # Human-readable model labels for sub-device types
 _NODE_TYPE_LABELS = {
@@ -38,12 +40,21 @@ def panel_device_info(serial_number: str, firmware_version: str = "") -> DeviceI
     return info
 
 
+@lru_cache(maxsize=256)
+def _subdevice_identifier(serial: str, node_id: str) -> tuple[str, str]:
+    """Return the registry identifier of a child device, built once per node."""
+    return (DOMAIN, f"{serial}_{node_id}")
+
+
 def subdevice_info(
     serial: str, node_id: str, node_type: str, name: str
 ) -> DeviceInfo:
-    """Build a DeviceInfo for a child device (circuit, BESS, PV, EVSE, site metering)."""
+    """Build a DeviceInfo for a child device (circuit, BESS, PV, EVSE, site metering).
+
+    Returns a fresh mapping on every call; only the identifier tuple is shared.
+    """
     return DeviceInfo(
-        identifiers={(DOMAIN, f"{serial}_{node_id}")},
+        identifiers={_subdevice_identifier(serial, node_id)},
         name=name,
         manufacturer="SPAN",
         model=_NODE_TYPE_LABELS.get(node_type, "Unknown"),
@@ -51,6 +62,19 @@ def subdevice_info(
     )
 
 
+def subdevice_entity_info(serial: str, node_id: str, name: str) -> DeviceInfo:
+    """Build the DeviceInfo an entity attaches to its child device.
+
+    Only identifiers and name are set here; the full registry entry (model,
+    via_device) comes from subdevice_info.  Entities on the same device share
+    the immutable identifier tuple but each gets its own mapping and set.
+    """
+    return DeviceInfo(
+        identifiers={_subdevice_identifier(serial, node_id)},
+        name=name,
+    )
+
+
 def make_unique_id(serial_number: str, node_id: str, property_id: str) -> str:
     """Build a unique entity ID: {serial}_{node}_{property}."""
     return f"{serial_number}_{node_id}_{property_id}"
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from functools import cache
+import json
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, NamedTuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -21,6 +26,7 @@ from custom_components.span_ebus.const import (
     CONF_SERIAL_NUMBER,
     DOMAIN,
 )
+from custom_components.span_ebus.node_mappers import EntitySpec, entities_from_description
 
 MOCK_SERIAL = "nt-0000-abc12"
 MOCK_CIRCUIT_UUID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
@@ -33,7 +39,8 @@ MOCK_BROKER_HOST = f"span-{MOCK_SERIAL}.local"
 MOCK_BROKER_PORT = 8883
 MOCK_CA_CERT = "-----BEGIN CERTIFICATE-----\nTEST\n-----END CERTIFICATE-----"
 
-MOCK_CONFIG_DATA = {
+# Read-only: shared by every test that builds a MockConfigEntry
+MOCK_CONFIG_DATA = MappingProxyType({
     CONF_HOST: MOCK_HOST,
     CONF_SERIAL_NUMBER: MOCK_SERIAL,
     CONF_ACCESS_TOKEN: MOCK_ACCESS_TOKEN,
@@ -42,7 +49,7 @@ MOCK_CONFIG_DATA = {
     CONF_EBUS_BROKER_HOST: MOCK_BROKER_HOST,
     CONF_EBUS_BROKER_PORT: MOCK_BROKER_PORT,
     CONF_CA_CERT_PEM: MOCK_CA_CERT,
-}
+})
 
 
 MOCK_DESCRIPTION = {
@@ -236,6 +243,71 @@ def mock_controller():
     return controller
 
 
+@cache
+def _cached_entities(desc_json: str) -> tuple[EntitySpec, ...]:
+    """Parse a JSON-serialized description; memoized since the mapper is pure.
+
+    The key keeps the description's key order, so the mapper sees nodes and
+    properties in the same order as an uncached call.
+    """
+    return tuple(entities_from_description(json.loads(desc_json)))
+
+
+def entities(desc: dict[str, Any], panel: Any = None) -> Sequence[EntitySpec]:
+    """Return entity specs for a description, cached when no panel is given.
+
+    Panel-backed parsing reads live property values, so it bypasses the cache.
+    """
+    if panel is not None:
+        return entities_from_description(desc, panel=panel)
+    return _cached_entities(json.dumps(desc))
+
+
+def stub_panel(serial_number: str, property_value: str | None = None) -> SimpleNamespace:
+    """Build a minimal panel for entities_from_description naming lookups."""
+    return SimpleNamespace(
+        serial_number=serial_number,
+        get_property_value=lambda *_args, **_kwargs: property_value,
+    )
+
+
+def _noop() -> None:
+    """Unregister function returned by PanelStub."""
+
+
+class PanelStub:
+    """The slice of SpanPanel an entity touches, without MagicMock.
+
+    set_property calls are recorded in calls as (node_id, property_id, value).
+    """
+
+    __slots__ = ("calls",)
+
+    serial_number = MOCK_SERIAL
+    available = True
+
+    def __init__(self) -> None:
+        """Start with no recorded calls."""
+        self.calls: list[tuple[str, str, str]] = []
+
+    def register_property_callback(self, node_id, property_id, cb):
+        """Accept the callback and return a no-op unregister."""
+        return _noop
+
+    def register_availability_callback(self, cb):
+        """Accept the callback and return a no-op unregister."""
+        return _noop
+
+    def get_property_value(self, node_id, property_id):
+        """Report no cached value."""
+        return None
+
+    def set_property(self, node_id, property_id, value):
+        """Record the call and report success."""
+        self.calls.append((node_id, property_id, value))
+        return True
+
+
 @pytest.fixture
 def mock_discovered_device():
     """Create a mock DiscoveredDevice."""
@@ -250,3 +322,33 @@ def mock_discovered_device():
 
     device.get_property = get_property
     return device
+
+
+@pytest.fixture(scope="session")
+def mock_specs() -> tuple[EntitySpec, ...]:
+    """Entity specs for MOCK_DESCRIPTION without a panel, parsed once per session.
+
+    Parsing is deterministic without a panel and tests only read the specs.
+    """
+    return tuple(entities_from_description(MOCK_DESCRIPTION))
+
+
+class SpecsIndex(NamedTuple):
+    """Entity specs with lookups by (node_id, property_id) and by node_id."""
+
+    specs: tuple[EntitySpec, ...]
+    by_key: dict[tuple[str, str], EntitySpec]
+    by_node: dict[str, list[EntitySpec]]
+
+
+@pytest.fixture(scope="session")
+def mock_specs_index(mock_specs: tuple[EntitySpec, ...]) -> SpecsIndex:
+    """Index mock_specs once so tests look specs up instead of scanning."""
+    by_node: defaultdict[str, list[EntitySpec]] = defaultdict(list)
+    for spec in mock_specs:
+        by_node[spec.node_id].append(spec)
+    return SpecsIndex(
+        specs=mock_specs,
+        by_key={(s.node_id, s.property_id): s for s in mock_specs},
+        by_node=dict(by_node),
+    )
@@ -12,87 +12,75 @@ from homeassistant.const import Platform
 from custom_components.span_ebus.binary_sensor import SpanEbusBinarySensor
 from custom_components.span_ebus.node_mappers import EntitySpec
 
-from .conftest import MOCK_SERIAL
+from .conftest import PanelStub
 
 
 @pytest.fixture
 def mock_panel():
-    panel = MagicMock()
-    panel.serial_number = MOCK_SERIAL
-    panel.available = True
-    panel.register_property_callback = MagicMock(return_value=lambda: None)
-    panel.register_availability_callback = MagicMock(return_value=lambda: None)
-    panel.get_property_value = MagicMock(return_value=None)
-    return panel
-
-
-def test_door_sensor_open_is_tamper(mock_panel):
-    """Test door OPEN means tamper detected (is_on=True)."""
-    spec = EntitySpec(
-        platform=Platform.BINARY_SENSOR,
-        node_id="core",
-        property_id="door",
-        name="Door",
-        device_class=BinarySensorDeviceClass.TAMPER,
-        on_values={"OPEN"},
-    )
+    return PanelStub()
+
+
+# Specs are pure data and never mutated by entities, so tests share them
+DOOR_SPEC = EntitySpec(
+    platform=Platform.BINARY_SENSOR,
+    node_id="core",
+    property_id="door",
+    name="Door",
+    device_class=BinarySensorDeviceClass.TAMPER,
+    on_values=("OPEN",),
+)
+
+ETHERNET_SPEC = EntitySpec(
+    platform=Platform.BINARY_SENSOR,
+    node_id="core",
+    property_id="ethernet",
+    name="Ethernet",
+    device_class=BinarySensorDeviceClass.CONNECTIVITY,
+)
+
+
+@pytest.mark.parametrize(
+    ("spec", "value", "expected"),
+    [
+        # Door OPEN means tamper detected; matching is case-insensitive
+        (DOOR_SPEC, "OPEN", True),
+        (DOOR_SPEC, "open", True),
+        (DOOR_SPEC, "CLOSED", False),
+        (DOOR_SPEC, "UNKNOWN", False),
+        # Boolean-typed sensors use the default truthy set
+        (ETHERNET_SPEC, "true", True),
+        (ETHERNET_SPEC, "1", True),
+        (ETHERNET_SPEC, "on", True),
+        (ETHERNET_SPEC, "yes", True),
+        (ETHERNET_SPEC, "connected", True),
+        (ETHERNET_SPEC, "false", False),
+        (ETHERNET_SPEC, "0", False),
+        (ETHERNET_SPEC, "off", False),
+    ],
+)
+def test_binary_sensor_value(mock_panel, spec, value, expected):
+    """Test raw MQTT values map to the expected is_on state."""
     sensor = SpanEbusBinarySensor(mock_panel, spec)
 
-    sensor._update_from_value("OPEN")
-    assert sensor._attr_is_on is True
-    sensor._update_from_value("open")
-    assert sensor._attr_is_on is True
-
-
-def test_door_sensor_closed_is_no_tamper(mock_panel):
-    """Test door CLOSED means no tamper (is_on=False)."""
-    spec = EntitySpec(
-        platform=Platform.BINARY_SENSOR,
-        node_id="core",
-        property_id="door",
-        name="Door",
-        device_class=BinarySensorDeviceClass.TAMPER,
-        on_values={"OPEN"},
-    )
-    sensor = SpanEbusBinarySensor(mock_panel, spec)
-
-    sensor._update_from_value("CLOSED")
-    assert sensor._attr_is_on is False
-    sensor._update_from_value("UNKNOWN")
-    assert sensor._attr_is_on is False
-
-
-def test_boolean_sensor_truthy_values(mock_panel):
-    """Test boolean-typed binary sensors use default truthy set."""
-    spec = EntitySpec(
-        platform=Platform.BINARY_SENSOR,
-        node_id="core",
-        property_id="ethernet",
-        name="Ethernet",
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-    )
-    sensor = SpanEbusBinarySensor(mock_panel, spec)
-
-    for value in ("true", "1", "on", "yes"):
-        sensor._update_from_value(value)
-        assert sensor._attr_is_on is True, f"Expected True for '{value}'"
-
-    for value in ("false", "0", "off"):
-        sensor._update_from_value(value)
-        assert sensor._attr_is_on is False, f"Expected False for '{value}'"
+    sensor._update_from_value(value)
+    assert sensor._attr_is_on is expected
 
 
 def test_connectivity_sensor(mock_panel):
     """Test connectivity binary sensor init."""
-    spec = EntitySpec(
-        platform=Platform.BINARY_SENSOR,
-        node_id="core",
-        property_id="ethernet",
-        name="Ethernet",
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-    )
-    sensor = SpanEbusBinarySensor(mock_panel, spec)
+    sensor = SpanEbusBinarySensor(mock_panel, ETHERNET_SPEC)
     assert sensor._attr_device_class == BinarySensorDeviceClass.CONNECTIVITY
 
-    sensor._update_from_value("connected")
-    assert sensor._attr_is_on is True
+
+def test_availability_write_only_on_change(mock_panel):
+    """Test availability callbacks write state only when it flips."""
+    sensor = SpanEbusBinarySensor(mock_panel, ETHERNET_SPEC)
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._on_availability_update(True)
+    sensor.async_write_ha_state.assert_not_called()
+
+    sensor._on_availability_update(False)
+    sensor._on_availability_update(False)
+    assert sensor.async_write_ha_state.call_count == 1
+    assert sensor.available is False
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from homeassistant import config_entries
+from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
@@ -14,7 +15,11 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.span_ebus.api_client import SpanAuthError, SpanConnectionError
-from custom_components.span_ebus.const import CONF_SERIAL_NUMBER, DOMAIN
+from custom_components.span_ebus.const import (
+    CONF_MEMORY_DIAGNOSTICS,
+    CONF_SERIAL_NUMBER,
+    DOMAIN,
+)
 
 from .conftest import (
     MOCK_CONFIG_DATA,
@@ -22,15 +27,25 @@ from .conftest import (
     MOCK_SERIAL,
 )
 
+DISCOVERY_INFO = ZeroconfServiceInfo(
+    ip_address="192.168.1.100",
+    ip_addresses=["192.168.1.100"],
+    port=8883,
+    hostname="span-nt-0000-abc12.local.",
+    type="_ebus._tcp.local.",
+    name="span-nt-0000-abc12._ebus._tcp.local.",
+    properties={},
+)
+
 
 @pytest.fixture(autouse=True)
 def _enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations for all config flow tests."""
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def _mock_setup_entry():
-    """Prevent actual setup during config flow tests."""
+    """Prevent actual setup during config flow tests (stateless, patched once)."""
     with patch(
         "custom_components.span_ebus.async_setup_entry",
         return_value=True,
@@ -40,7 +55,10 @@ def _mock_setup_entry():
 
 @pytest.fixture(autouse=True)
 def _patch_api_client(mock_api_client):
-    """Patch SpanApiClient for all config flow tests."""
+    """Patch SpanApiClient for all config flow tests.
+
+    Stays per-test: tests set side effects on the function-scoped client.
+    """
     with patch(
         "custom_components.span_ebus.config_flow.SpanApiClient",
         return_value=mock_api_client,
@@ -48,6 +66,33 @@ def _patch_api_client(mock_api_client):
         yield
 
 
+async def _choose_passphrase(hass: HomeAssistant, flow_id: str) -> ConfigFlowResult:
+    """Pick passphrase auth from the auth menu."""
+    return await hass.config_entries.flow.async_configure(
+        flow_id, {"next_step_id": "auth_passphrase"}
+    )
+
+
+async def _submit_passphrase(
+    hass: HomeAssistant, flow_id: str, passphrase: str
+) -> ConfigFlowResult:
+    """Submit the passphrase form."""
+    return await hass.config_entries.flow.async_configure(
+        flow_id, {"passphrase": passphrase}
+    )
+
+
+@pytest.fixture
+async def started_user_flow(hass: HomeAssistant) -> ConfigFlowResult:
+    """Start a user flow and submit the host, returning the auth menu result."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"host": MOCK_HOST}
+    )
+
+
 async def test_user_flow_passphrase(
     hass: HomeAssistant,
     mock_api_client,
@@ -67,16 +112,12 @@ async def test_user_flow_passphrase(
     assert result["step_id"] == "auth_menu"
 
     # Choose passphrase
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"next_step_id": "auth_passphrase"}
-    )
+    result = await _choose_passphrase(hass, result["flow_id"])
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "auth_passphrase"
 
     # Enter passphrase
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"passphrase": "test-passphrase"}
-    )
+    result = await _submit_passphrase(hass, result["flow_id"], "test-passphrase")
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == f"SPAN Panel {MOCK_SERIAL}"
     assert result["data"][CONF_SERIAL_NUMBER] == MOCK_SERIAL
@@ -85,14 +126,10 @@ async def test_user_flow_passphrase(
 async def test_user_flow_door_bypass(
     hass: HomeAssistant,
     mock_api_client,
+    started_user_flow: ConfigFlowResult,
 ) -> None:
     """Test manual user flow with door bypass auth."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"host": MOCK_HOST}
-    )
+    result = started_user_flow
     assert result["type"] is FlowResultType.MENU
 
     # Choose door bypass
@@ -129,49 +166,32 @@ async def test_user_flow_cannot_connect(
 async def test_user_flow_invalid_passphrase(
     hass: HomeAssistant,
     mock_api_client,
+    started_user_flow: ConfigFlowResult,
 ) -> None:
     """Test passphrase auth with invalid passphrase."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"host": MOCK_HOST}
-    )
-
     # Choose passphrase
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"next_step_id": "auth_passphrase"}
-    )
+    result = await _choose_passphrase(hass, started_user_flow["flow_id"])
 
     # First attempt: invalid
     mock_api_client.register.side_effect = SpanAuthError("Invalid passphrase")
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"passphrase": "wrong"}
-    )
+    result = await _submit_passphrase(hass, result["flow_id"], "wrong")
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
 
     # Second attempt: valid
     mock_api_client.register.side_effect = None
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"passphrase": "correct"}
-    )
+    result = await _submit_passphrase(hass, result["flow_id"], "correct")
     assert result["type"] is FlowResultType.CREATE_ENTRY
 
 
 async def test_door_bypass_not_active(
     hass: HomeAssistant,
     mock_api_client,
+    started_user_flow: ConfigFlowResult,
 ) -> None:
     """Test door bypass when not active."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
     result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"host": MOCK_HOST}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"next_step_id": "auth_door_bypass"}
+        started_user_flow["flow_id"], {"next_step_id": "auth_door_bypass"}
     )
 
     mock_api_client.register.side_effect = SpanAuthError("Not active")
@@ -187,31 +207,17 @@ async def test_zeroconf_discovery(
     mock_api_client,
 ) -> None:
     """Test zeroconf discovery flow."""
-    discovery_info = ZeroconfServiceInfo(
-        ip_address="192.168.1.100",
-        ip_addresses=["192.168.1.100"],
-        port=8883,
-        hostname="span-nt-0000-abc12.local.",
-        type="_ebus._tcp.local.",
-        name="span-nt-0000-abc12._ebus._tcp.local.",
-        properties={},
-    )
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_ZEROCONF},
-        data=discovery_info,
+        data=DISCOVERY_INFO,
     )
     assert result["type"] is FlowResultType.MENU
     assert result["step_id"] == "auth_menu"
 
     # Choose passphrase and complete
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"next_step_id": "auth_passphrase"}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], {"passphrase": "test"}
-    )
+    result = await _choose_passphrase(hass, result["flow_id"])
+    result = await _submit_passphrase(hass, result["flow_id"], "test")
     assert result["type"] is FlowResultType.CREATE_ENTRY
 
 
@@ -227,20 +233,30 @@ async def test_zeroconf_already_configured(
     )
     entry.add_to_hass(hass)
 
-    discovery_info = ZeroconfServiceInfo(
-        ip_address="192.168.1.100",
-        ip_addresses=["192.168.1.100"],
-        port=8883,
-        hostname="span-nt-0000-abc12.local.",
-        type="_ebus._tcp.local.",
-        name="span-nt-0000-abc12._ebus._tcp.local.",
-        properties={},
-    )
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_ZEROCONF},
-        data=discovery_info,
+        data=DISCOVERY_INFO,
     )
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "already_configured"
+
+
+async def test_options_flow_memory_diagnostics(hass: HomeAssistant) -> None:
+    """Test the options flow toggles memory diagnostics."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_SERIAL,
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MEMORY_DIAGNOSTICS: True}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == {CONF_MEMORY_DIAGNOSTICS: True}
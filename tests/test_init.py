@@ -3,28 +3,52 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Callable
+import logging
+import tracemalloc
+from unittest.mock import MagicMock
 
 import pytest
 
-from custom_components.span_ebus.__init__ import _wait_for_circuit_names
+from custom_components.span_ebus.__init__ import (
+    _start_memory_diagnostics,
+    _stop_memory_diagnostics,
+    _wait_for_circuit_names,
+)
+from custom_components.span_ebus.models import SpanDomainData
+
+# These tests use FakePanel rather than hass, so one event loop serves the module
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class FakePanel:
     """Minimal panel mock with controllable property values and callbacks."""
 
+    __slots__ = ("_property_values", "_callbacks")
+
     def __init__(self) -> None:
         self._property_values: dict[tuple[str, str], str] = {}
-        self._callbacks: dict[tuple[str, str], list[Callable[[str], None]]] = {}
+        self._callbacks: defaultdict[tuple[str, str], list[Callable[[str], None]]] = (
+            defaultdict(list)
+        )
 
     def get_property_value(self, node_id: str, property_id: str) -> str | None:
         return self._property_values.get((node_id, property_id))
 
+    def snapshot_property(self, property_id: str) -> dict[str, str | None]:
+        """Return {node_id: value} for every stored value of property_id."""
+        return {
+            nid: value
+            for (nid, pid), value in self._property_values.items()
+            if pid == property_id
+        }
+
     def register_property_callback(
         self, node_id: str, property_id: str, cb: Callable[[str], None]
     ) -> Callable[[], None]:
         key = (node_id, property_id)
-        self._callbacks.setdefault(key, []).append(cb)
+        self._callbacks[key].append(cb)
 
         def unreg() -> None:
             cbs = self._callbacks.get(key)
@@ -36,7 +60,10 @@ class FakePanel:
     def simulate_property_arrival(self, node_id: str, property_id: str, value: str) -> None:
         """Simulate an MQTT property value arriving: store it and fire callbacks."""
         self._property_values[(node_id, property_id)] = value
-        for cb in list(self._callbacks.get((node_id, property_id), [])):
+        cbs = self._callbacks.get((node_id, property_id))
+        if not cbs:
+            return
+        for cb in tuple(cbs):
             cb(value)
 
 
@@ -45,7 +72,6 @@ def panel():
     return FakePanel()
 
 
-@pytest.mark.asyncio
 async def test_wait_names_already_available(panel):
     """All circuit names available immediately — returns True without delay."""
     panel._property_values[("circuit-1", "name")] = "Kitchen"
@@ -57,32 +83,33 @@ async def test_wait_names_already_available(panel):
     assert result is True
 
 
-@pytest.mark.asyncio
-async def test_wait_names_timeout(panel):
-    """No names arrive — returns False after timeout."""
-    result = await _wait_for_circuit_names(
-        panel, ["circuit-1", "circuit-2"], timeout=0.3
-    )
+@pytest.mark.parametrize(
+    ("preload", "circuit_ids"),
+    [
+        # No names arrive
+        ({}, ["circuit-1", "circuit-2"]),
+        # Only some names arrive
+        ({("circuit-1", "name"): "Kitchen"}, ["circuit-1", "circuit-2"]),
+        # Single circuit
+        ({}, ["circuit-1"]),
+    ],
+)
+async def test_wait_names_timeout(panel, preload, circuit_ids):
+    """Missing names time out with False and temporary callbacks are removed."""
+    panel._property_values.update(preload)
+
+    result = await _wait_for_circuit_names(panel, circuit_ids, timeout=0)
     assert result is False
+    assert not any(panel._callbacks.values())
 
 
-@pytest.mark.asyncio
-async def test_wait_names_partial_timeout(panel):
-    """Only some names arrive — returns False after timeout."""
-    panel._property_values[("circuit-1", "name")] = "Kitchen"
-
-    result = await _wait_for_circuit_names(
-        panel, ["circuit-1", "circuit-2"], timeout=0.3
-    )
-    assert result is False
-
-
-@pytest.mark.asyncio
 async def test_wait_names_arrive_via_callback(panel):
     """Names arrive via callback after registration — returns True."""
 
     async def deliver_names():
-        await asyncio.sleep(0.05)
+        # _wait_for_circuit_names registers its callbacks before its first
+        # await, so one scheduler turn is enough
+        await asyncio.sleep(0)
         panel.simulate_property_arrival("circuit-1", "name", "Kitchen")
         panel.simulate_property_arrival("circuit-2", "name", "Bedroom")
 
@@ -94,14 +121,12 @@ async def test_wait_names_arrive_via_callback(panel):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_names_empty_list(panel):
     """Empty circuit list — returns True immediately."""
     result = await _wait_for_circuit_names(panel, [], timeout=1.0)
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_names_callbacks_cleaned_up(panel):
     """Temporary callbacks are unregistered after completion."""
     panel._property_values[("circuit-1", "name")] = "Kitchen"
@@ -113,10 +138,62 @@ async def test_wait_names_callbacks_cleaned_up(panel):
     assert len(cbs) == 0
 
 
-@pytest.mark.asyncio
-async def test_wait_names_callbacks_cleaned_up_on_timeout(panel):
-    """Temporary callbacks are unregistered even on timeout."""
-    await _wait_for_circuit_names(panel, ["circuit-1"], timeout=0.1)
 
-    cbs = panel._callbacks.get(("circuit-1", "name"), [])
-    assert len(cbs) == 0
+@pytest.fixture
+def diag_timers(monkeypatch):
+    """Record memory diagnostics timers instead of scheduling them on hass."""
+    timers: list[MagicMock] = []
+
+    def _track(hass, action, interval):
+        timers.append(unsub := MagicMock())
+        return unsub
+
+    monkeypatch.setattr(
+        "custom_components.span_ebus.__init__.async_track_time_interval", _track
+    )
+    tracemalloc.stop()
+    yield timers
+    tracemalloc.stop()
+
+
+async def test_memory_diagnostics_stop_with_last_entry(diag_timers, caplog):
+    """One timer serves all opted-in entries and stops after the last one."""
+    caplog.set_level(logging.INFO, logger="custom_components.span_ebus")
+    domain_data = SpanDomainData()
+
+    _start_memory_diagnostics(None, domain_data, "entry-1")
+    _start_memory_diagnostics(None, domain_data, "entry-2")
+    assert len(diag_timers) == 1
+    assert tracemalloc.is_tracing()
+
+    _stop_memory_diagnostics(domain_data, "entry-1")
+    diag_timers[0].assert_not_called()
+    assert tracemalloc.is_tracing()
+
+    _stop_memory_diagnostics(domain_data, "entry-2")
+    diag_timers[0].assert_called_once()
+    assert domain_data.memory_diag_unsub is None
+    assert not tracemalloc.is_tracing()
+
+
+async def test_memory_diagnostics_need_info_logging(diag_timers, caplog):
+    """Nothing is traced or scheduled when INFO logs would be dropped."""
+    caplog.set_level(logging.WARNING, logger="custom_components.span_ebus")
+    domain_data = SpanDomainData()
+
+    _start_memory_diagnostics(None, domain_data, "entry-1")
+    assert not diag_timers
+    assert not tracemalloc.is_tracing()
+    _stop_memory_diagnostics(domain_data, "entry-1")
+
+
+async def test_memory_diagnostics_leave_external_tracemalloc(diag_timers, caplog):
+    """Tracing started outside the integration is left running on stop."""
+    caplog.set_level(logging.INFO, logger="custom_components.span_ebus")
+    domain_data = SpanDomainData()
+    tracemalloc.start()
+
+    _start_memory_diagnostics(None, domain_data, "entry-1")
+    _stop_memory_diagnostics(domain_data, "entry-1")
+    diag_timers[0].assert_called_once()
+    assert tracemalloc.is_tracing()
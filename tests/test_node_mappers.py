@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
@@ -11,90 +13,104 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
+import pytest
 
+from custom_components.span_ebus.const import DOMAIN
 from custom_components.span_ebus.node_mappers import (
+    _humanize,
     _parse_enum_format,
     entities_from_description,
 )
+from custom_components.span_ebus.util import subdevice_entity_info, subdevice_info
 
-from .conftest import MOCK_CIRCUIT_UUID, MOCK_DESCRIPTION
+from .conftest import MOCK_CIRCUIT_UUID, MOCK_DESCRIPTION, entities, stub_panel
+
+_BESS_SUBDEVICE_DESC = {
+    "nodes": {
+        "bess": {
+            "name": "Distribution Enclosure Commissioned Backup System",
+            "type": "energy.ebus.device.bess",
+            "properties": {
+                "soc": {"name": "SOC", "datatype": "float", "unit": "%"},
+            },
+        }
+    }
+}
+
+_PV_SUBDEVICE_DESC = {
+    "nodes": {
+        "pv": {
+            "name": "Distribution Enclosure Commissioned PV System",
+            "type": "energy.ebus.device.pv",
+            "properties": {
+                "power-w": {"name": "Power", "datatype": "float", "unit": "W"},
+            },
+        }
+    }
+}
 
 
-def test_entities_from_description():
+def test_entities_from_description(mock_specs):
     """Test that entities are created from mock description."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    assert len(specs) > 0
+    assert len(mock_specs) > 0
 
     # Check we got the expected platforms
-    platforms = {s.platform for s in specs}
+    platforms = {s.platform for s in mock_specs}
     assert Platform.SENSOR in platforms
     assert Platform.BINARY_SENSOR in platforms
     assert Platform.SWITCH in platforms
     assert Platform.SELECT in platforms
 
 
-def test_core_door_binary_sensor():
+def test_spec_keys_unique(mock_specs_index):
+    """Test each (node_id, property_id) maps to exactly one spec."""
+    assert len(mock_specs_index.by_key) == len(mock_specs_index.specs)
+
+
+def test_core_door_binary_sensor(mock_specs_index):
     """Test core door produces a tamper binary sensor."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    door = [s for s in specs if s.node_id == "core" and s.property_id == "door"]
-    assert len(door) == 1
-    assert door[0].platform == Platform.BINARY_SENSOR
-    assert door[0].device_class == BinarySensorDeviceClass.TAMPER
+    door = mock_specs_index.by_key[("core", "door")]
+    assert door.platform == Platform.BINARY_SENSOR
+    assert door.device_class == BinarySensorDeviceClass.TAMPER
 
 
-def test_core_ethernet_connectivity():
+def test_core_ethernet_connectivity(mock_specs_index):
     """Test core ethernet produces a connectivity binary sensor."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    eth = [s for s in specs if s.node_id == "core" and s.property_id == "ethernet"]
-    assert len(eth) == 1
-    assert eth[0].device_class == BinarySensorDeviceClass.CONNECTIVITY
-    assert eth[0].entity_category == EntityCategory.DIAGNOSTIC
+    eth = mock_specs_index.by_key[("core", "ethernet")]
+    assert eth.device_class == BinarySensorDeviceClass.CONNECTIVITY
+    assert eth.entity_category == EntityCategory.DIAGNOSTIC
 
 
-def test_core_software_version_diagnostic_sensor():
+def test_core_software_version_diagnostic_sensor(mock_specs_index):
     """Test core software-version produces a diagnostic sensor."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    fw = [s for s in specs if s.property_id == "software-version"]
-    assert len(fw) == 1
-    assert fw[0].platform == Platform.SENSOR
-    assert fw[0].entity_category == EntityCategory.DIAGNOSTIC
+    fw = mock_specs_index.by_key[("core", "software-version")]
+    assert fw.platform == Platform.SENSOR
+    assert fw.entity_category == EntityCategory.DIAGNOSTIC
 
 
-def test_circuit_relay_switch():
+def test_circuit_relay_switch(mock_specs_index):
     """Test circuit relay produces a switch."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    relay = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "relay"
-    ]
-    assert len(relay) == 1
-    assert relay[0].platform == Platform.SWITCH
-    assert relay[0].settable is True
+    relay = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "relay")]
+    assert relay.platform == Platform.SWITCH
+    assert relay.settable is True
 
 
-def test_circuit_active_power_sensor():
+def test_circuit_active_power_sensor(mock_specs_index):
     """Test circuit active-power produces a power sensor in W.
 
     Firmware bug: schema declares kW but values are actually watts.
     """
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    power = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "active-power"
-    ]
-    assert len(power) == 1
-    assert power[0].device_class == SensorDeviceClass.POWER
-    assert power[0].state_class == SensorStateClass.MEASUREMENT
-    assert power[0].native_unit == UnitOfPower.WATT
-    assert power[0].negate is True
+    power = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "active-power")]
+    assert power.device_class == SensorDeviceClass.POWER
+    assert power.state_class == SensorStateClass.MEASUREMENT
+    assert power.native_unit == UnitOfPower.WATT
+    assert power.negate is True
 
 
-def test_circuit_energy_sensors():
+def test_circuit_energy_sensors(mock_specs_index):
     """Test circuit energy properties produce TOTAL_INCREASING sensors."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
     energy = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and "energy" in s.property_id
+        s for s in mock_specs_index.by_node[MOCK_CIRCUIT_UUID] if "energy" in s.property_id
     ]
     assert len(energy) == 2
     for e in energy:
@@ -103,28 +119,17 @@ def test_circuit_energy_sensors():
         assert e.native_unit == UnitOfEnergy.WATT_HOUR
 
 
-def test_circuit_shed_priority_select():
+def test_circuit_shed_priority_select(mock_specs_index):
     """Test circuit shed-priority produces a select with options."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    priority = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "shed-priority"
-    ]
-    assert len(priority) == 1
-    assert priority[0].platform == Platform.SELECT
-    assert priority[0].options == ["MUST_HAVE", "NICE_TO_HAVE", "NON_ESSENTIAL"]
-    assert priority[0].settable is True
+    priority = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "shed-priority")]
+    assert priority.platform == Platform.SELECT
+    assert priority.options == ("MUST_HAVE", "NICE_TO_HAVE", "NON_ESSENTIAL")
+    assert priority.settable is True
 
 
 def test_circuit_naming_with_panel():
     """Test circuit device_name uses panel name when available."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-0000-abc12"
-    panel.get_property_value = MagicMock(return_value="Kitchen")
-
-    specs = entities_from_description(MOCK_DESCRIPTION, panel=panel)
+    specs = entities(MOCK_DESCRIPTION, panel=stub_panel("nt-0000-abc12", "Kitchen"))
     relay = [
         s for s in specs
         if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "relay"
@@ -136,23 +141,17 @@ def test_circuit_naming_with_panel():
     assert relay[0].node_type == "energy.ebus.device.circuit"
 
 
-def test_circuit_naming_fallback():
+def test_circuit_naming_fallback(mock_specs_index):
     """Test circuit device_name falls back to short UUID without panel."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    relay = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "relay"
-    ]
-    assert len(relay) == 1
+    relay = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "relay")]
     # Entity name is relative, device_name uses UUID fallback
-    assert relay[0].name == "Relay"
-    assert MOCK_CIRCUIT_UUID[:6] in relay[0].device_name
+    assert relay.name == "Relay"
+    assert MOCK_CIRCUIT_UUID[:6] in relay.device_name
 
 
-def test_power_flows_sensors():
+def test_power_flows_sensors(mock_specs_index):
     """Test power-flows node produces power sensors."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    pf = [s for s in specs if s.node_id == "power-flows"]
+    pf = mock_specs_index.by_node["power-flows"]
     assert len(pf) == 2
     for s in pf:
         assert s.device_class == SensorDeviceClass.POWER
@@ -161,9 +160,9 @@ def test_power_flows_sensors():
 
 def test_parse_enum_format():
     """Test parsing Homie enum format strings."""
-    assert _parse_enum_format("OPEN,CLOSED") == ["OPEN", "CLOSED"]
-    assert _parse_enum_format("a, b, c") == ["a", "b", "c"]
-    assert _parse_enum_format("") == []
+    assert _parse_enum_format("OPEN,CLOSED") == ("OPEN", "CLOSED")
+    assert _parse_enum_format("a, b, c") == ("a", "b", "c")
+    assert _parse_enum_format("") == ()
 
 
 def test_unknown_nodes_skipped():
@@ -179,7 +178,7 @@ def test_unknown_nodes_skipped():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 0
 
 
@@ -216,15 +215,16 @@ def test_bess_node():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 3
-    soc = [s for s in specs if s.property_id == "soc"][0]
+    by_pid = {s.property_id: s for s in specs}
+    soc = by_pid["soc"]
     assert soc.device_class == SensorDeviceClass.BATTERY
     assert soc.native_unit == "%"
-    soe = [s for s in specs if s.property_id == "soe"][0]
+    soe = by_pid["soe"]
     assert soe.device_class == SensorDeviceClass.ENERGY_STORAGE
     assert soe.native_unit == UnitOfEnergy.KILO_WATT_HOUR
-    power = [s for s in specs if "power" in s.property_id][0]
+    power = by_pid["power-w"]
     assert power.device_class == SensorDeviceClass.POWER
 
 
@@ -242,55 +242,77 @@ def test_pv_node():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 2
 
 
-def test_circuit_current_sensor():
-    """Test circuit current property produces a current sensor."""
-    desc = {
+def _mk_desc(node_id: str, node_type: str, prop_id: str, prop_spec: dict) -> dict:
+    """Build a one-node, one-property $description."""
+    return {
         "nodes": {
-            "uuid-node": {
-                "name": "Test Circuit",
-                "type": "energy.ebus.device.circuit",
-                "properties": {
-                    "current": {
-                        "name": "Current",
-                        "datatype": "float",
-                        "unit": "A",
-                    },
-                },
+            node_id: {
+                "name": "Test Node",
+                "type": node_type,
+                "properties": {prop_id: prop_spec},
             }
         }
     }
-    specs = entities_from_description(desc)
-    assert len(specs) == 1
-    assert specs[0].device_class == SensorDeviceClass.CURRENT
-    assert specs[0].native_unit == UnitOfElectricCurrent.AMPERE
 
 
-def test_circuit_breaker_rating_sensor():
-    """Test circuit breaker-rating produces a diagnostic sensor."""
-    desc = {
-        "nodes": {
-            "uuid-node": {
-                "name": "Test Circuit",
-                "type": "energy.ebus.device.circuit",
-                "properties": {
-                    "breaker-rating": {
-                        "name": "Breaker Rating",
-                        "datatype": "integer",
-                        "unit": "A",
-                    },
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc)
+@pytest.mark.parametrize(
+    ("node_id", "node_type", "prop_id", "prop_spec", "device_class", "unit", "category"),
+    [
+        pytest.param(
+            "uuid-node",
+            "energy.ebus.device.circuit",
+            "current",
+            {"name": "Current", "datatype": "float", "unit": "A"},
+            SensorDeviceClass.CURRENT,
+            UnitOfElectricCurrent.AMPERE,
+            None,
+            id="circuit-current",
+        ),
+        pytest.param(
+            "uuid-node",
+            "energy.ebus.device.circuit",
+            "breaker-rating",
+            {"name": "Breaker Rating", "datatype": "integer", "unit": "A"},
+            SensorDeviceClass.CURRENT,
+            UnitOfElectricCurrent.AMPERE,
+            EntityCategory.DIAGNOSTIC,
+            id="circuit-breaker-rating",
+        ),
+        pytest.param(
+            "bess",
+            "energy.ebus.device.bess",
+            "nameplate-capacity",
+            {"name": "Capacity", "datatype": "float", "unit": "Wh"},
+            SensorDeviceClass.ENERGY_STORAGE,
+            UnitOfEnergy.WATT_HOUR,
+            EntityCategory.DIAGNOSTIC,
+            id="bess-nameplate-capacity-wh",
+        ),
+        pytest.param(
+            "pv",
+            "energy.ebus.device.pv",
+            "nameplate-capacity",
+            {"name": "Capacity", "datatype": "float", "unit": "W"},
+            SensorDeviceClass.POWER,
+            UnitOfPower.WATT,
+            EntityCategory.DIAGNOSTIC,
+            id="pv-nameplate-capacity-w",
+        ),
+    ],
+)
+def test_single_property_mapping(
+    node_id, node_type, prop_id, prop_spec, device_class, unit, category
+):
+    """Test a single property maps to one sensor with the expected class, unit and category."""
+    specs = entities(_mk_desc(node_id, node_type, prop_id, prop_spec))
     assert len(specs) == 1
-    assert specs[0].device_class == SensorDeviceClass.CURRENT
-    assert specs[0].native_unit == UnitOfElectricCurrent.AMPERE
-    assert specs[0].entity_category == EntityCategory.DIAGNOSTIC
+    assert specs[0].device_class == device_class
+    assert specs[0].native_unit == unit
+    assert specs[0].entity_category == category
 
 
 def test_core_voltage_sensors():
@@ -315,7 +337,7 @@ def test_core_voltage_sensors():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 2
     for s in specs:
         assert s.device_class == SensorDeviceClass.VOLTAGE
@@ -324,8 +346,6 @@ def test_core_voltage_sensors():
 
 def test_humanize_abbreviations():
     """Test _humanize handles known abbreviations correctly."""
-    from custom_components.span_ebus.node_mappers import _humanize
-
     assert _humanize("pv-power") == "PV Power"
     assert _humanize("ev-charger") == "EV Charger"
     assert _humanize("soc") == "SOC"
@@ -333,20 +353,18 @@ def test_humanize_abbreviations():
     assert _humanize("grid-power") == "Grid Power"
 
 
-def test_core_entities_have_no_subdevice():
+def test_core_entities_have_no_subdevice(mock_specs_index):
     """Test core entities have empty node_type and device_name."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    core_specs = [s for s in specs if s.node_id == "core"]
+    core_specs = mock_specs_index.by_node["core"]
     assert len(core_specs) > 0
     for s in core_specs:
         assert s.node_type == ""
         assert s.device_name == ""
 
 
-def test_circuit_specs_have_subdevice_fields():
+def test_circuit_specs_have_subdevice_fields(mock_specs_index):
     """Test circuit entity specs have node_type and device_name set."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    circuit_specs = [s for s in specs if s.node_id == MOCK_CIRCUIT_UUID]
+    circuit_specs = mock_specs_index.by_node[MOCK_CIRCUIT_UUID]
     assert len(circuit_specs) > 0
     for s in circuit_specs:
         assert s.node_type == "energy.ebus.device.circuit"
@@ -355,18 +373,7 @@ def test_circuit_specs_have_subdevice_fields():
 
 def test_bess_specs_have_subdevice_fields():
     """Test BESS entity specs have node_type and friendly device_name."""
-    desc = {
-        "nodes": {
-            "bess": {
-                "name": "Distribution Enclosure Commissioned Backup System",
-                "type": "energy.ebus.device.bess",
-                "properties": {
-                    "soc": {"name": "SOC", "datatype": "float", "unit": "%"},
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc)
+    specs = entities(_BESS_SUBDEVICE_DESC)
     assert len(specs) == 1
     assert specs[0].node_type == "energy.ebus.device.bess"
     assert specs[0].device_name == "Battery Storage"
@@ -375,102 +382,42 @@ def test_bess_specs_have_subdevice_fields():
 
 def test_pv_specs_have_subdevice_fields():
     """Test PV entity specs have node_type and friendly device_name."""
-    desc = {
-        "nodes": {
-            "pv": {
-                "name": "Distribution Enclosure Commissioned PV System",
-                "type": "energy.ebus.device.pv",
-                "properties": {
-                    "power-w": {"name": "Power", "datatype": "float", "unit": "W"},
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc)
+    specs = entities(_PV_SUBDEVICE_DESC)
     assert len(specs) == 1
     assert specs[0].node_type == "energy.ebus.device.pv"
     assert specs[0].device_name == "Solar PV"
     assert specs[0].name == "Power W"
 
 
-def test_power_flow_entities_are_subdevice():
+def test_power_flow_entities_are_subdevice(mock_specs_index):
     """Test power-flow entities create a Site Metering sub-device."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    pf_specs = [s for s in specs if s.node_id == "power-flows"]
+    pf_specs = mock_specs_index.by_node["power-flows"]
     assert len(pf_specs) > 0
     for s in pf_specs:
         assert s.node_type == "energy.ebus.device.power-flows"
         assert s.device_name == "Site Metering"
 
 
-def test_bess_device_name_with_serial_suffix():
-    """Test BESS device_name includes short serial suffix when panel is provided."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-2024-g5h6j"
-    panel.get_property_value = MagicMock(return_value=None)
-
-    desc = {
-        "nodes": {
-            "bess": {
-                "name": "Distribution Enclosure Commissioned Backup System",
-                "type": "energy.ebus.device.bess",
-                "properties": {
-                    "soc": {"name": "SOC", "datatype": "float", "unit": "%"},
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc, panel=panel)
-    assert len(specs) == 1
-    assert specs[0].device_name == "g5h6j Battery Storage"
-
-
-def test_pv_device_name_with_serial_suffix():
-    """Test PV device_name includes short serial suffix when panel is provided."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-2024-a1b2c"
-    panel.get_property_value = MagicMock(return_value=None)
-
-    desc = {
-        "nodes": {
-            "pv": {
-                "name": "Distribution Enclosure Commissioned PV System",
-                "type": "energy.ebus.device.pv",
-                "properties": {
-                    "power-w": {"name": "Power", "datatype": "float", "unit": "W"},
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc, panel=panel)
-    assert len(specs) == 1
-    assert specs[0].device_name == "a1b2c Solar PV"
-
-
-def test_power_flows_device_name_with_serial_suffix():
-    """Test power-flows device_name includes short serial suffix when panel is provided."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-2024-g5h6j"
-    panel.get_property_value = MagicMock(return_value=None)
-
-    specs = entities_from_description(MOCK_DESCRIPTION, panel=panel)
-    pf_specs = [s for s in specs if s.node_id == "power-flows"]
-    assert len(pf_specs) > 0
-    for s in pf_specs:
-        assert s.device_name == "g5h6j Site Metering"
+@pytest.mark.parametrize(
+    ("desc", "node_id", "serial", "expected"),
+    [
+        (_BESS_SUBDEVICE_DESC, "bess", "nt-2024-g5h6j", "g5h6j Battery Storage"),
+        (_PV_SUBDEVICE_DESC, "pv", "nt-2024-a1b2c", "a1b2c Solar PV"),
+        (MOCK_DESCRIPTION, "power-flows", "nt-2024-g5h6j", "g5h6j Site Metering"),
+    ],
+    ids=["bess", "pv", "power-flows"],
+)
+def test_device_name_with_serial_suffix(desc, node_id, serial, expected):
+    """Test sub-device names include the short serial suffix when a panel is provided."""
+    specs = entities(desc, panel=stub_panel(serial))
+    node_specs = [s for s in specs if s.node_id == node_id]
+    assert len(node_specs) > 0
+    for s in node_specs:
+        assert s.device_name == expected
 
 
 def test_subdevice_info_via_device():
     """Test subdevice_info creates DeviceInfo with correct via_device."""
-    from custom_components.span_ebus.const import DOMAIN
-    from custom_components.span_ebus.util import subdevice_info
-
     info = subdevice_info(
         serial="nt-0000-abc12",
         node_id="uuid-123",
@@ -486,8 +433,6 @@ def test_subdevice_info_via_device():
 
 def test_subdevice_info_bess_model():
     """Test subdevice_info uses correct model label for BESS."""
-    from custom_components.span_ebus.util import subdevice_info
-
     info = subdevice_info(
         serial="nt-0000-abc12",
         node_id="bess-1",
@@ -499,8 +444,6 @@ def test_subdevice_info_bess_model():
 
 def test_subdevice_info_pv_model():
     """Test subdevice_info uses correct model label for PV."""
-    from custom_components.span_ebus.util import subdevice_info
-
     info = subdevice_info(
         serial="nt-0000-abc12",
         node_id="pv-1",
@@ -512,8 +455,6 @@ def test_subdevice_info_pv_model():
 
 def test_subdevice_info_evse_model():
     """Test subdevice_info uses correct model label for EVSE."""
-    from custom_components.span_ebus.util import subdevice_info
-
     info = subdevice_info(
         serial="nt-0000-abc12",
         node_id="evse-1",
@@ -523,67 +464,66 @@ def test_subdevice_info_evse_model():
     assert info["model"] == "EV Charger"
 
 
-def test_dominant_power_source_is_select():
+def test_subdevice_info_shares_identifier():
+    """Test subdevice_info reuses the entity identifier but not the mapping."""
+    args = ("nt-0000-abc12", "uuid-123", "energy.ebus.device.circuit", "Kitchen")
+    info = subdevice_info(*args)
+    assert subdevice_info(*args) is not info
+    entity_info = subdevice_entity_info("nt-0000-abc12", "uuid-123", "Kitchen")
+    assert next(iter(info["identifiers"])) is next(iter(entity_info["identifiers"]))
+
+
+def test_subdevice_entity_info():
+    """Test entities on one child device share the identifier, not the mapping."""
+    info = subdevice_entity_info("nt-0000-abc12", "uuid-123", "Kitchen")
+    assert info["identifiers"] == {(DOMAIN, "nt-0000-abc12_uuid-123")}
+    assert info["name"] == "Kitchen"
+    other = subdevice_entity_info("nt-0000-abc12", "uuid-123", "Kitchen")
+    assert other is not info
+    assert other["identifiers"] is not info["identifiers"]
+    assert next(iter(other["identifiers"])) is next(iter(info["identifiers"]))
+
+
+def test_dominant_power_source_is_select(mock_specs_index):
     """Test dominant-power-source produces a settable Select entity."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    dps = [s for s in specs if s.property_id == "dominant-power-source"]
-    assert len(dps) == 1
-    assert dps[0].platform == Platform.SELECT
-    assert dps[0].settable is True
-    assert "GRID" in dps[0].options
-    assert "BATTERY" in dps[0].options
-    assert "PV" in dps[0].options
+    dps = mock_specs_index.by_key[("core", "dominant-power-source")]
+    assert dps.platform == Platform.SELECT
+    assert dps.settable is True
+    assert "GRID" in dps.options
+    assert "BATTERY" in dps.options
+    assert "PV" in dps.options
 
 
-def test_core_door_has_on_values():
+def test_core_door_has_on_values(mock_specs_index):
     """Test door binary sensor has on_values set for enum handling."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    door = [s for s in specs if s.property_id == "door"]
-    assert len(door) == 1
-    assert door[0].on_values == {"OPEN"}
+    door = mock_specs_index.by_key[("core", "door")]
+    assert door.on_values == ("OPEN",)
 
 
-def test_core_relay_has_on_values():
+def test_core_relay_has_on_values(mock_specs_index):
     """Test main relay binary sensor has on_values for CLOSED=on."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    relay = [s for s in specs if s.node_id == "core" and s.property_id == "relay"]
-    assert len(relay) == 1
-    assert relay[0].on_values == {"CLOSED"}
+    relay = mock_specs_index.by_key[("core", "relay")]
+    assert relay.on_values == ("CLOSED",)
 
 
-def test_circuit_space_diagnostic():
+def test_circuit_space_diagnostic(mock_specs_index):
     """Test circuit space property produces a diagnostic sensor."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    space = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "space"
-    ]
-    assert len(space) == 1
-    assert space[0].platform == Platform.SENSOR
-    assert space[0].entity_category == EntityCategory.DIAGNOSTIC
+    space = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "space")]
+    assert space.platform == Platform.SENSOR
+    assert space.entity_category == EntityCategory.DIAGNOSTIC
 
 
-def test_circuit_dipole_binary_sensor():
+def test_circuit_dipole_binary_sensor(mock_specs_index):
     """Test circuit dipole property produces a diagnostic binary sensor."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    dipole = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "dipole"
-    ]
-    assert len(dipole) == 1
-    assert dipole[0].platform == Platform.BINARY_SENSOR
-    assert dipole[0].entity_category == EntityCategory.DIAGNOSTIC
+    dipole = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "dipole")]
+    assert dipole.platform == Platform.BINARY_SENSOR
+    assert dipole.entity_category == EntityCategory.DIAGNOSTIC
 
 
-def test_circuit_pcs_priority_sensor():
+def test_circuit_pcs_priority_sensor(mock_specs_index):
     """Test circuit pcs-priority produces a sensor (integer, not select)."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    pcs = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "pcs-priority"
-    ]
-    assert len(pcs) == 1
-    assert pcs[0].platform == Platform.SENSOR
+    pcs = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "pcs-priority")]
+    assert pcs.platform == Platform.SENSOR
 
 
 def test_bess_metadata_properties():
@@ -607,37 +547,16 @@ def test_bess_metadata_properties():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 5
-    vendor = [s for s in specs if s.property_id == "vendor-name"][0]
+    by_pid = {s.property_id: s for s in specs}
+    vendor = by_pid["vendor-name"]
     assert vendor.entity_category == EntityCategory.DIAGNOSTIC
-    cap = [s for s in specs if s.property_id == "nameplate-capacity"][0]
+    cap = by_pid["nameplate-capacity"]
     assert cap.device_class == SensorDeviceClass.ENERGY_STORAGE
     assert cap.native_unit == UnitOfEnergy.KILO_WATT_HOUR
 
 
-def test_bess_nameplate_capacity_wh_unit():
-    """Test BESS nameplate-capacity respects Wh unit from $description."""
-    desc = {
-        "nodes": {
-            "bess": {
-                "name": "Battery",
-                "type": "energy.ebus.device.bess",
-                "properties": {
-                    "nameplate-capacity": {
-                        "name": "Capacity",
-                        "datatype": "float",
-                        "unit": "Wh",
-                    },
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc)
-    cap = specs[0]
-    assert cap.native_unit == UnitOfEnergy.WATT_HOUR
-
-
 def test_pv_metadata_properties():
     """Test PV node maps metadata properties."""
     desc = {
@@ -657,35 +576,13 @@ def test_pv_metadata_properties():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 3
     cap = [s for s in specs if s.property_id == "nameplate-capacity"][0]
     assert cap.device_class == SensorDeviceClass.POWER
     assert cap.native_unit == UnitOfPower.KILO_WATT
 
 
-def test_pv_nameplate_capacity_watts_unit():
-    """Test PV nameplate-capacity respects W unit from $description."""
-    desc = {
-        "nodes": {
-            "pv": {
-                "name": "Solar",
-                "type": "energy.ebus.device.pv",
-                "properties": {
-                    "nameplate-capacity": {
-                        "name": "Capacity",
-                        "datatype": "float",
-                        "unit": "W",
-                    },
-                },
-            }
-        }
-    }
-    specs = entities_from_description(desc)
-    cap = specs[0]
-    assert cap.native_unit == UnitOfPower.WATT
-
-
 def test_evse_comprehensive():
     """Test EVSE node maps status, lock-state, advertised-current, metadata."""
     desc = {
@@ -707,13 +604,14 @@ def test_evse_comprehensive():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 5
-    status = [s for s in specs if s.property_id == "status"][0]
+    by_pid = {s.property_id: s for s in specs}
+    status = by_pid["status"]
     assert status.icon == "mdi:ev-station"
-    lock = [s for s in specs if s.property_id == "lock-state"][0]
+    lock = by_pid["lock-state"]
     assert lock.icon == "mdi:lock"
-    current = [s for s in specs if s.property_id == "advertised-current"][0]
+    current = by_pid["advertised-current"]
     assert current.device_class == SensorDeviceClass.CURRENT
     assert current.native_unit == UnitOfElectricCurrent.AMPERE
 
@@ -742,14 +640,15 @@ def test_pcs_node():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 4
+    by_pid = {s.property_id: s for s in specs}
     booleans = [s for s in specs if s.platform == Platform.BINARY_SENSOR]
     assert len(booleans) == 2
-    current = [s for s in specs if s.property_id == "import-limit"][0]
+    current = by_pid["import-limit"]
     assert current.device_class == SensorDeviceClass.CURRENT
     assert current.native_unit == UnitOfElectricCurrent.AMPERE
-    enum_sensor = [s for s in specs if s.property_id == "grid-import-limit-enablement"][0]
+    enum_sensor = by_pid["grid-import-limit-enablement"]
     assert enum_sensor.platform == Platform.SENSOR
     assert enum_sensor.entity_category == EntityCategory.DIAGNOSTIC
 
@@ -772,28 +671,21 @@ def test_lug_feed_diagnostic():
             }
         }
     }
-    specs = entities_from_description(desc)
+    specs = entities(desc)
     assert len(specs) == 2
     feed = [s for s in specs if s.property_id == "feed"][0]
     assert feed.entity_category == EntityCategory.DIAGNOSTIC
     assert "Upstream" in feed.name
 
 
-def test_circuit_energy_naming():
+def test_circuit_energy_naming(mock_specs_index):
     """Test circuit exported-energy is 'Energy' (consumption), imported is 'Energy Returned'."""
-    specs = entities_from_description(MOCK_DESCRIPTION)
-    imported = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "imported-energy"
-    ]
-    exported = [
-        s for s in specs
-        if s.node_id == MOCK_CIRCUIT_UUID and s.property_id == "exported-energy"
-    ]
+    imported = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "imported-energy")]
+    exported = mock_specs_index.by_key[(MOCK_CIRCUIT_UUID, "exported-energy")]
     assert len(imported) == 1
-    assert imported[0].name == "Energy Returned"
+    assert imported.name == "Energy Returned"
     assert len(exported) == 1
-    assert exported[0].name == "Energy"
+    assert exported.name == "Energy"
 
 
 def test_upstream_lug_naming():
@@ -828,11 +720,11 @@ def test_upstream_lug_naming():
             }
         }
     }
-    specs = entities_from_description(desc)
-    imported = [s for s in specs if s.property_id == "imported-energy"][0]
-    exported = [s for s in specs if s.property_id == "exported-energy"][0]
-    power = [s for s in specs if s.property_id == "active-power"][0]
-    current = [s for s in specs if s.property_id == "current"][0]
+    by_pid = {s.property_id: s for s in entities(desc)}
+    imported = by_pid["imported-energy"]
+    exported = by_pid["exported-energy"]
+    power = by_pid["active-power"]
+    current = by_pid["current"]
     # Upstream: clean names since device is already "Site Metering" or panel-level
     assert imported.name == "Energy"
     assert exported.name == "Energy Returned"
@@ -868,10 +760,10 @@ def test_downstream_lug_naming():
             }
         }
     }
-    specs = entities_from_description(desc)
-    imported = [s for s in specs if s.property_id == "imported-energy"][0]
-    exported = [s for s in specs if s.property_id == "exported-energy"][0]
-    power = [s for s in specs if s.property_id == "active-power"][0]
+    by_pid = {s.property_id: s for s in entities(desc)}
+    imported = by_pid["imported-energy"]
+    exported = by_pid["exported-energy"]
+    power = by_pid["active-power"]
     assert imported.name == "Downstream Energy"
     assert exported.name == "Downstream Energy Returned"
     assert power.name == "Downstream Power"
@@ -882,11 +774,6 @@ def test_downstream_lug_naming():
 
 def test_pv_feed_creates_generation_power():
     """PV with feed→circuit creates generation-power entity on the circuit."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-0000-abc12"
-
     def get_prop(node_id, prop_id):
         if node_id == "pv-node" and prop_id == "feed":
             return MOCK_CIRCUIT_UUID
@@ -894,7 +781,7 @@ def test_pv_feed_creates_generation_power():
             return "Commissioned PV System"
         return None
 
-    panel.get_property_value = MagicMock(side_effect=get_prop)
+    panel = SimpleNamespace(serial_number="nt-0000-abc12", get_property_value=get_prop)
 
     desc = {
         "nodes": {
@@ -925,7 +812,7 @@ def test_pv_feed_creates_generation_power():
             },
         }
     }
-    specs = entities_from_description(desc, panel=panel)
+    specs = entities(desc, panel=panel)
     gen = [s for s in specs if s.property_id == "generation-power"]
     assert len(gen) == 1
     assert gen[0].node_id == MOCK_CIRCUIT_UUID
@@ -940,11 +827,7 @@ def test_pv_feed_creates_generation_power():
 
 def test_no_pv_no_generation_power():
     """Without PV nodes, no generation-power entities are created."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-0000-abc12"
-    panel.get_property_value = MagicMock(return_value=None)
+    panel = stub_panel("nt-0000-abc12")
 
     # Description with only a circuit, no PV node
     desc = {
@@ -962,18 +845,14 @@ def test_no_pv_no_generation_power():
             },
         }
     }
-    specs = entities_from_description(desc, panel=panel)
+    specs = entities(desc, panel=panel)
     gen = [s for s in specs if s.property_id == "generation-power"]
     assert len(gen) == 0
 
 
 def test_pv_feed_not_resolved_no_generation_power():
     """PV exists but feed value is None (not yet resolved), no generation-power entity."""
-    from unittest.mock import MagicMock
-
-    panel = MagicMock()
-    panel.serial_number = "nt-0000-abc12"
-    panel.get_property_value = MagicMock(return_value=None)
+    panel = stub_panel("nt-0000-abc12")
 
     desc = {
         "nodes": {
@@ -997,6 +876,6 @@ def test_pv_feed_not_resolved_no_generation_power():
             },
         }
     }
-    specs = entities_from_description(desc, panel=panel)
+    specs = entities(desc, panel=panel)
     gen = [s for s in specs if s.property_id == "generation-power"]
     assert len(gen) == 0
@@ -34,7 +34,7 @@ def priority_spec():
         property_id="shed-priority",
         name="Kitchen Shed Priority",
         settable=True,
-        options=["MUST_HAVE", "NICE_TO_HAVE", "NON_ESSENTIAL"],
+        options=("MUST_HAVE", "NICE_TO_HAVE", "NON_ESSENTIAL"),
     )
 
 
@@ -116,6 +116,55 @@ def test_string_sensor_update(mock_panel):
     assert sensor._attr_native_value == "spanos2/r202546/03"
 
 
+def test_unchanged_value_skips_state_write(mock_panel):
+    """Test a repeated value does not write state again."""
+    spec = EntitySpec(
+        platform=Platform.SENSOR,
+        node_id=MOCK_CIRCUIT_UUID,
+        property_id="active-power",
+        name="Kitchen Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit=UnitOfPower.WATT,
+    )
+    sensor = SpanEbusSensor(mock_panel, spec)
+    sensor._coalesce_writes = False
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._on_value_update("150.5")
+    sensor._on_value_update("150.5")
+    assert sensor.async_write_ha_state.call_count == 1
+
+    sensor._on_value_update("151.0")
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_burst_coalesced_into_one_write(mock_panel):
+    """Test updates before the panel flush produce a single write."""
+    spec = EntitySpec(
+        platform=Platform.SENSOR,
+        node_id=MOCK_CIRCUIT_UUID,
+        property_id="active-power",
+        name="Kitchen Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit=UnitOfPower.WATT,
+    )
+    sensor = SpanEbusSensor(mock_panel, spec)
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._on_value_update("150.5")
+    sensor._on_value_update("151.0")
+    sensor._on_value_update("152.5")
+    mock_panel.mark_dirty.assert_called_with(sensor)
+    sensor.async_write_ha_state.assert_not_called()
+
+    # Panel flush fires: the latest value is written once
+    sensor._flush_state()
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor._attr_native_value == 152.5
+
+
 def test_sensor_should_not_poll(mock_panel):
     """Test sensor has polling disabled."""
     spec = EntitySpec(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -54,6 +54,47 @@ async def test_register_property_callback(panel: SpanPanel) -> None:
     assert received == ["150.5"]  # No new value
 
 
+async def test_unregister_during_dispatch(panel: SpanPanel) -> None:
+    """Test a callback removed mid-dispatch does not disturb the current pass."""
+    received = []
+    unregister_first = None
+
+    def first(value: str):
+        received.append(("first", value))
+        unregister_first()
+
+    def second(value: str):
+        received.append(("second", value))
+
+    unregister_first = panel.register_property_callback("uuid-node", "relay", first)
+    panel.register_property_callback("uuid-node", "relay", second)
+
+    panel._dispatch_property_update(("uuid-node", "relay"), "OPEN")
+    panel._dispatch_property_update(("uuid-node", "relay"), "CLOSED")
+    assert received == [("first", "OPEN"), ("second", "OPEN"), ("second", "CLOSED")]
+
+
+async def test_property_updates_drained_in_one_wakeup(
+    panel: SpanPanel, hass: HomeAssistant
+) -> None:
+    """Test a burst of paho-thread updates is bridged with a single wakeup."""
+    received = []
+    panel.register_property_callback("uuid-node", "active-power", received.append)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as call_soon:
+        for value in ("1", "2", "3"):
+            panel._on_property_changed(MOCK_SERIAL, "uuid-node", "active-power", value, None)
+        # Unsubscribed properties are not queued
+        panel._on_property_changed(MOCK_SERIAL, "uuid-node", "current", "9", None)
+        assert call_soon.call_count == 1
+
+    await asyncio.sleep(0)
+    # Superseded values from the same burst are dropped
+    assert received == ["3"]
+
+
 async def test_register_availability_callback(panel: SpanPanel) -> None:
     """Test availability callbacks."""
     states = []
@@ -122,3 +163,64 @@ async def test_on_description_received_sets_event(
     # In tests, we need to yield to let call_soon_threadsafe execute
     await asyncio.sleep(0)
     assert panel.description_received.is_set()
+
+
+async def test_snapshot_property(panel: SpanPanel, mock_discovered_device) -> None:
+    """Test snapshot_property returns one property across all nodes."""
+    assert panel.snapshot_property("name") == {}
+
+    mock_discovered_device.properties = {
+        "circuit-1": {"name": "Kitchen", "relay": "CLOSED"},
+        "circuit-2": {"relay": "OPEN"},
+    }
+    panel._on_device_discovered(mock_discovered_device)
+
+    assert panel.snapshot_property("name") == {
+        "circuit-1": "Kitchen",
+        "circuit-2": None,
+    }
+
+
+async def test_register_node_property_callback(panel: SpanPanel) -> None:
+    """Test wildcard callbacks receive updates for any node."""
+    received = []
+
+    def on_update(node_id: str, value: str):
+        received.append((node_id, value))
+
+    unregister = panel.register_node_property_callback("name", on_update)
+
+    panel._dispatch_property_update(("circuit-1", "name"), "Kitchen")
+    panel._dispatch_property_update(("circuit-2", "name"), "Bedroom")
+    panel._dispatch_property_update(("circuit-1", "relay"), "OPEN")
+    assert received == [("circuit-1", "Kitchen"), ("circuit-2", "Bedroom")]
+
+    unregister()
+    panel._dispatch_property_update(("circuit-1", "name"), "Pantry")
+    assert len(received) == 2
+
+
+async def test_mark_dirty_batches_state_writes(panel: SpanPanel) -> None:
+    """Test entities marked dirty are flushed together by one timer."""
+    first = MagicMock()
+    second = MagicMock()
+
+    panel.mark_dirty(first)
+    handle = panel._flush_handle
+    panel.mark_dirty(second)
+    panel.mark_dirty(first)
+    assert panel._flush_handle is handle
+
+    panel._flush_dirty()
+    first._flush_state.assert_called_once()
+    second._flush_state.assert_called_once()
+    assert panel._flush_handle is None
+
+    # A discarded entity is skipped; the pending timer is cancelled on stop
+    panel.mark_dirty(first)
+    panel.discard_dirty(first)
+    panel._flush_dirty()
+    first._flush_state.assert_called_once()
+    panel.mark_dirty(second)
+    await panel.async_stop()
+    assert panel._flush_handle is None
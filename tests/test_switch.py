@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from homeassistant.const import Platform
@@ -11,63 +9,64 @@ from homeassistant.const import Platform
 from custom_components.span_ebus.node_mappers import EntitySpec
 from custom_components.span_ebus.switch import SpanEbusSwitch
 
-from .conftest import MOCK_CIRCUIT_UUID, MOCK_SERIAL
+from .conftest import MOCK_CIRCUIT_UUID, PanelStub
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_panel():
-    panel = MagicMock()
-    panel.serial_number = MOCK_SERIAL
-    panel.available = True
-    panel.register_property_callback = MagicMock(return_value=lambda: None)
-    panel.register_availability_callback = MagicMock(return_value=lambda: None)
-    panel.get_property_value = MagicMock(return_value=None)
-    panel.set_property = MagicMock(return_value=True)
-    return panel
-
-
-@pytest.fixture
-def relay_spec():
-    return EntitySpec(
-        platform=Platform.SWITCH,
-        node_id=MOCK_CIRCUIT_UUID,
-        property_id="relay",
-        name="Kitchen Relay",
-        settable=True,
-        icon="mdi:electric-switch",
-    )
+    return PanelStub()
 
 
-def test_switch_closed_is_on(mock_panel, relay_spec):
-    """Test relay CLOSED maps to is_on=True."""
-    switch = SpanEbusSwitch(mock_panel, relay_spec)
-    switch._update_from_value("CLOSED")
-    assert switch._attr_is_on is True
+@pytest.fixture(autouse=True)
+def _reset_panel(mock_panel):
+    """Clear recorded calls so each test sees a fresh session panel."""
+    mock_panel.calls.clear()
 
 
-def test_switch_open_is_off(mock_panel, relay_spec):
-    """Test relay OPEN maps to is_on=False."""
-    switch = SpanEbusSwitch(mock_panel, relay_spec)
-    switch._update_from_value("OPEN")
-    assert switch._attr_is_on is False
+# Specs are pure data and never mutated by entities, so tests share one
+RELAY_SPEC = EntitySpec(
+    platform=Platform.SWITCH,
+    node_id=MOCK_CIRCUIT_UUID,
+    property_id="relay",
+    name="Kitchen Relay",
+    settable=True,
+    icon="mdi:electric-switch",
+)
 
 
-def test_switch_case_insensitive(mock_panel, relay_spec):
-    """Test relay value parsing is case-insensitive."""
-    switch = SpanEbusSwitch(mock_panel, relay_spec)
-    switch._update_from_value("closed")
-    assert switch._attr_is_on is True
+@pytest.fixture(scope="session")
+def relay_spec():
+    return RELAY_SPEC
 
 
-async def test_turn_on(mock_panel, relay_spec):
+@pytest.fixture
+def switch(mock_panel, relay_spec):
+    return SpanEbusSwitch(mock_panel, relay_spec)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("CLOSED", True),
+        ("OPEN", False),
+        # Relay value parsing is case-insensitive
+        ("closed", True),
+    ],
+    ids=["closed_upper", "open_upper", "closed_lower"],
+)
+def test_switch_value_mapping(switch, value, expected):
+    """Test relay CLOSED maps to is_on=True and OPEN to is_on=False."""
+    switch._update_from_value(value)
+    assert switch._attr_is_on is expected
+
+
+async def test_turn_on(mock_panel, switch):
     """Test turn_on sends CLOSED."""
-    switch = SpanEbusSwitch(mock_panel, relay_spec)
     await switch.async_turn_on()
-    mock_panel.set_property.assert_called_once_with(MOCK_CIRCUIT_UUID, "relay", "CLOSED")
+    assert mock_panel.calls == [(MOCK_CIRCUIT_UUID, "relay", "CLOSED")]
 
 
-async def test_turn_off(mock_panel, relay_spec):
+async def test_turn_off(mock_panel, switch):
     """Test turn_off sends OPEN."""
-    switch = SpanEbusSwitch(mock_panel, relay_spec)
     await switch.async_turn_off()
-    mock_panel.set_property.assert_called_once_with(MOCK_CIRCUIT_UUID, "relay", "OPEN")
+    assert mock_panel.calls == [(MOCK_CIRCUIT_UUID, "relay", "OPEN")]